@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """Setup script for Claude Conversation Extractor"""
 
-import atexit
+import os
 from pathlib import Path
 
 from setuptools import setup
@@ -15,18 +15,39 @@ class PostInstallCommand(install):
         install.run(self)
 
         # Print helpful messages after installation
-        def print_success_message():
-            print("\n🎉 Installation complete!")
-            print("\n📋 Quick Start Commands:")
-            print("  claude-start         # Interactive UI with logo & real-time search")
-            print("  claude-extract       # CLI for extraction & searching")
-            print("  claude-search        # Search and view conversations")
-            print("\n⭐ If you find this tool helpful, please star us on GitHub:")
-            print("   https://github.com/ZeroSumQuant/claude-conversation-extractor")
-            print("\nThank you for using Claude Conversation Extractor! 🚀\n")
+        print("\n🎉 Installation complete!")
+        print("\n📋 Quick Start Commands:")
+        print("  claude-start         # Interactive UI with logo & real-time search")
+        print("  claude-extract       # CLI for extraction & searching")
+        print("  claude-search        # Search and view conversations")
+        print("\n⭐ If you find this tool helpful, please star us on GitHub:")
+        print("   https://github.com/ZeroSumQuant/claude-conversation-extractor")
+        print("\nThank you for using Claude Conversation Extractor! 🚀\n")
 
-        # Register to run after pip finishes
-        atexit.register(print_success_message)
+
+# Optionally compile the search modules to C with mypyc, which needs mypy in
+# the build environment:
+#   pip install "mypy[mypyc]"
+#   CCX_MYPYC=1 pip install --no-build-isolation .
+# The pure-Python modules are still installed alongside the extensions.
+ext_modules = []
+if os.environ.get("CCX_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    # Resolve modules from src/ so they get the top-level names they are
+    # installed and imported under, not src.<name> from src/__init__.py;
+    # other modules are only followed for their types
+    os.environ["MYPYPATH"] = "src"
+    ext_modules = mypycify(
+        [
+            "--ignore-missing-imports",
+            "--explicit-package-bases",
+            "--follow-imports=silent",
+            "--always-false=_IN_PACKAGE",
+            "src/index_builder.py",
+            "src/search_conversations.py",
+        ]
+    )
 
 
 # Read the README for long description
@@ -79,6 +100,7 @@ setup(
         "extract_claude_logs",
         "interactive_ui",
         "search_conversations",
+        "index_builder",
         "realtime_search",
         "search_cli",
     ],
@@ -90,6 +112,7 @@ setup(
             "claude-search=search_cli:main",                          # Direct search command
         ],
     },
+    ext_modules=ext_modules,
     cmdclass={
         "install": PostInstallCommand,
     },
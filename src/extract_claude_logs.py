@@ -9,9 +9,16 @@ readable markdown files.
 
 import argparse
 import json
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# orjson is optional; it parses JSONL entries several times faster than json
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 
 class ClaudeConversationExtractor:
@@ -75,11 +82,9 @@ class ClaudeConversationExtractor:
         conversation = []
 
         try:
-            with open(jsonl_path, "r", encoding="utf-8") as f:
-                for line in f:
+            with closing(self.iter_messages(jsonl_path)) as entries:
+                for entry in entries:
                     try:
-                        entry = json.loads(line.strip())
-
                         # Extract user messages
                         if entry.get("type") == "user" and "message" in entry:
                             msg = entry["message"]
@@ -151,8 +156,6 @@ class ClaudeConversationExtractor:
                                         }
                                     )
 
-                    except json.JSONDecodeError:
-                        continue
                     except Exception:
                         # Silently skip problematic entries
                         continue
@@ -162,6 +165,24 @@ class ClaudeConversationExtractor:
 
         return conversation
 
+    def iter_messages(self, jsonl_path: Path) -> Iterator[Dict]:
+        """Stream parsed JSONL entries one at a time, skipping malformed lines.
+
+        Lines are parsed straight from bytes so callers that only need
+        counters never hold the whole conversation in memory.
+        """
+        with open(jsonl_path, "rb") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json_loads(line)
+                except ValueError:
+                    continue
+                if isinstance(entry, dict):
+                    yield entry
+
     def _extract_text_content(self, content, detailed: bool = False) -> str:
         """Extract text from various content formats Claude uses.
         
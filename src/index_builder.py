@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Trigram index for Claude Conversation Extractor search
+
+Records which three-character substrings occur in the lowercased message
+text of each conversation file. Any text containing a search term also
+contains all of the term's trigrams, so intersecting the files listed for
+those trigrams gives every file that can match. Only those files need to be
+opened and scanned.
+
+The index is persisted in the searcher's cache directory and refreshed one
+file at a time whenever a file's size or modification time changes. It is
+saved as a JSON header and file map followed by the raw doc id arrays, so
+loading a cache file never executes code from it. Saved indexes of
+directories that no longer exist are removed by prune_indexes().
+"""
+
+import hashlib
+import json
+import os
+import struct
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# Bump when the on-disk layout changes so stale indexes are rebuilt
+INDEX_VERSION = 3
+
+# Minimum seconds between saves while indexed files keep changing
+SAVE_INTERVAL = 30.0
+
+# Typecode of the doc id arrays in the postings
+DOC_ID_TYPE = "I"
+
+# Length of a trigram's UTF-8 bytes and its doc id count, per saved posting
+_POSTING_HEADER = struct.Struct("<HI")
+
+
+def trigrams(text: str) -> Set[str]:
+    """Return every three-character substring of text."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _read_header(f) -> dict:
+    """Read the JSON header line that starts every saved index."""
+    header = json.loads(f.readline(65536))
+    if not isinstance(header, dict):
+        raise ValueError("index header is not an object")
+    return header
+
+
+def prune_indexes(cache_dir: Path) -> None:
+    """
+    Delete saved indexes whose search directory is gone or whose layout is old.
+
+    Each index file starts with a one-line header naming its directory, so
+    only that line is read. Indexes from before the current file format are
+    deleted unread.
+    """
+    for index_file in cache_dir.glob("trigrams-*.pickle"):
+        try:
+            index_file.unlink()
+        except OSError:
+            pass
+
+    for index_file in cache_dir.glob("trigrams-*.idx"):
+        try:
+            with open(index_file, "rb") as f:
+                header = _read_header(f)
+            keep = header.get("version") == INDEX_VERSION and os.path.isdir(
+                header["search_dir"]
+            )
+        except Exception:
+            keep = False
+        if not keep:
+            try:
+                index_file.unlink()
+            except OSError:
+                pass
+
+
+class TrigramIndex:
+    """
+    Per-directory trigram index of conversation files.
+
+    Each indexed file gets a small integer doc id. The postings map every
+    trigram to an array of the doc ids containing it, and the file map holds
+    only (mtime_ns, size, doc_id) so unchanged files are never re-read.
+
+    A changed file is indexed under a new doc id and its old id is retired;
+    retired ids are dropped from the postings when the index is saved.
+    """
+
+    def __init__(self, search_dir: Path, cache_dir: Path):
+        """
+        Load the index for search_dir from cache_dir, if one was saved.
+
+        Args:
+            search_dir: Directory of conversation files being indexed
+            cache_dir: Directory the index file is stored in
+        """
+        self.search_dir = str(search_dir.resolve())
+        digest = hashlib.sha1(self.search_dir.encode("utf-8")).hexdigest()
+        self.index_file = cache_dir / f"trigrams-{digest[:16]}.idx"
+        self._files: Dict[str, Tuple[int, int, int]] = {}
+        self._paths: List[Optional[str]] = []  # Doc id -> path, None if retired
+        self._postings: Dict[str, array] = {}
+        self._retired = 0
+        self._last_save: Optional[float] = None
+        self._load()
+
+    def _load(self) -> None:
+        """Read a saved index, starting empty if it is missing or unreadable."""
+        try:
+            with open(self.index_file, "rb") as f:
+                header = _read_header(f)
+                if (
+                    header.get("version") != INDEX_VERSION
+                    or header.get("itemsize") != array(DOC_ID_TYPE).itemsize
+                    or header.get("byteorder") != sys.byteorder
+                ):
+                    return
+
+                files = {
+                    key: (int(mtime_ns), int(size), int(doc_id))
+                    for key, (mtime_ns, size, doc_id) in json.loads(
+                        f.readline()
+                    ).items()
+                }
+                paths: List[Optional[str]] = [None] * len(files)
+                for key, (_, _, doc_id) in files.items():
+                    paths[doc_id] = key
+                if None in paths:
+                    raise ValueError("doc ids are not contiguous")
+
+                postings = {}
+                while True:
+                    head = f.read(_POSTING_HEADER.size)
+                    if not head:
+                        break
+                    gram_len, count = _POSTING_HEADER.unpack(head)
+                    gram = f.read(gram_len).decode("utf-8", "surrogatepass")
+                    doc_ids = array(DOC_ID_TYPE)
+                    doc_ids.frombytes(f.read(count * doc_ids.itemsize))
+                    if len(doc_ids) != count or max(doc_ids) >= len(paths):
+                        raise ValueError("truncated or corrupt postings")
+                    postings[gram] = doc_ids
+        except Exception:
+            return
+
+        self._files = files
+        self._paths = paths
+        self._postings = postings
+
+    def save(self) -> None:
+        """Write the index atomically; failures only cost a rebuild later."""
+        self._last_save = time.monotonic()
+        self._compact()
+        tmp_file = self.index_file.with_suffix(".tmp")
+        try:
+            with open(tmp_file, "wb") as f:
+                # A separate header line lets prune_indexes() skip the rest
+                header = {
+                    "version": INDEX_VERSION,
+                    "search_dir": self.search_dir,
+                    "itemsize": array(DOC_ID_TYPE).itemsize,
+                    "byteorder": sys.byteorder,
+                }
+                f.write(json.dumps(header).encode("utf-8") + b"\n")
+                f.write(json.dumps(self._files).encode("utf-8") + b"\n")
+                for gram, doc_ids in self._postings.items():
+                    # Message text can hold lone surrogates from JSON escapes
+                    gram_bytes = gram.encode("utf-8", "surrogatepass")
+                    f.write(_POSTING_HEADER.pack(len(gram_bytes), len(doc_ids)))
+                    f.write(gram_bytes)
+                    f.write(doc_ids.tobytes())
+            os.replace(tmp_file, self.index_file)
+        except OSError:
+            pass
+
+    def update(
+        self,
+        files: List[Path],
+        read_texts: Callable[[Path], Iterable[str]],
+        prune: bool = True,
+    ) -> None:
+        """
+        Bring the index in line with the current set of files.
+
+        Args:
+            files: Conversation files under the indexed directory
+            read_texts: Returns the message texts of a file
+            prune: Drop entries for files not in files; pass False when
+                files is only a subset of the directory
+        """
+        changed = False
+        current = set()
+
+        for path in files:
+            key = str(path)
+            current.add(key)
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+
+            entry = self._files.get(key)
+            if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                continue
+
+            grams: Set[str] = set()
+            try:
+                for text in read_texts(path):
+                    grams |= trigrams(text.lower())
+            except Exception:
+                # Unreadable now; leave it unindexed so it is always scanned
+                if entry:
+                    del self._files[key]
+                    self._retire(entry[2])
+                    changed = True
+                continue
+
+            if entry:
+                self._retire(entry[2])
+            doc_id = self._add(key, grams)
+            self._files[key] = (stat.st_mtime_ns, stat.st_size, doc_id)
+            changed = True
+
+        if prune:
+            for key in self._files.keys() - current:
+                self._retire(self._files.pop(key)[2])
+                changed = True
+
+        # Live sessions change on nearly every search, so after the first
+        # save the file is rewritten at most once per SAVE_INTERVAL. Changes
+        # lost at exit only mean those files are re-read next time
+        if changed and (
+            self._last_save is None
+            or time.monotonic() - self._last_save >= SAVE_INTERVAL
+        ):
+            self.save()
+
+    def _add(self, key: str, grams: Set[str]) -> int:
+        """Post key's trigrams under a new doc id and return the id."""
+        doc_id = len(self._paths)
+        self._paths.append(key)
+        # New ids are the largest yet, so appending keeps each array sorted
+        for gram in grams:
+            doc_ids = self._postings.get(gram)
+            if doc_ids is None:
+                doc_ids = self._postings[gram] = array(DOC_ID_TYPE)
+            doc_ids.append(doc_id)
+        return doc_id
+
+    def _retire(self, doc_id: int) -> None:
+        """Stop returning doc_id; its postings are dropped by _compact()."""
+        self._paths[doc_id] = None
+        self._retired += 1
+
+    def _compact(self) -> None:
+        """Renumber live doc ids from zero and drop retired ones."""
+        if not self._retired:
+            return
+        new_ids = [-1] * len(self._paths)
+        paths: List[Optional[str]] = []
+        for doc_id, key in enumerate(self._paths):
+            if key is not None:
+                new_ids[doc_id] = len(paths)
+                paths.append(key)
+
+        postings = {}
+        for gram, doc_ids in self._postings.items():
+            kept = array(
+                DOC_ID_TYPE, [new_ids[i] for i in doc_ids if new_ids[i] >= 0]
+            )
+            if kept:
+                postings[gram] = kept
+
+        self._files = {
+            key: (mtime_ns, size, new_ids[doc_id])
+            for key, (mtime_ns, size, doc_id) in self._files.items()
+        }
+        self._paths = paths
+        self._postings.clear()
+        self._postings.update(postings)
+        self._retired = 0
+
+    def is_indexed(self, path: Path) -> bool:
+        """Whether path has up-to-date trigrams in the index."""
+        return str(path) in self._files
+
+    def files_containing(self, term: str) -> Optional[Set[str]]:
+        """
+        Return the indexed paths whose text may contain term (case-insensitive).
+
+        Returns None when term is too short to have a trigram, meaning every
+        file is a candidate.
+        """
+        grams = trigrams(term.lower())
+        if not grams:
+            return None
+
+        # Intersect the rarest postings first so the working set stays small
+        lists = sorted(
+            (self._postings.get(gram, array(DOC_ID_TYPE)) for gram in grams),
+            key=len,
+        )
+        result = set(lists[0])
+        for doc_ids in lists[1:]:
+            if not result:
+                break
+            result.intersection_update(doc_ids)
+        paths = self._paths
+        return {paths[i] for i in result if paths[i] is not None}
@@ -5,45 +5,28 @@ import os
 import platform
 import shutil
 import subprocess
-from datetime import datetime
+import sys
+import time
 from pathlib import Path
 from typing import List, Optional
 
 # Handle both package and direct execution imports
 try:
     from .extract_claude_logs import ClaudeConversationExtractor
-    from .realtime_search import RealTimeSearch, create_smart_searcher
+    from .realtime_search import KeyboardHandler, RealTimeSearch, create_smart_searcher
     from .search_conversations import ConversationSearcher
 except ImportError:
     # Fallback for direct execution or when not installed as package
     from extract_claude_logs import ClaudeConversationExtractor
-    from realtime_search import RealTimeSearch, create_smart_searcher
+    from realtime_search import KeyboardHandler, RealTimeSearch, create_smart_searcher
     from search_conversations import ConversationSearcher
 
+# Bright magenta banner, rendered once at import since its content is static
+MAGENTA = "\033[95m"
+RESET = "\033[0m"
+BOLD = "\033[1m"
 
-class InteractiveUI:
-    """Interactive terminal UI for easier conversation extraction"""
-
-    def __init__(self, output_dir: Optional[str] = None):
-        self.output_dir = output_dir
-        self.extractor = ClaudeConversationExtractor(output_dir)
-        self.searcher = ConversationSearcher()
-        self.sessions: List[Path] = []
-        self.terminal_width = shutil.get_terminal_size().columns
-
-    def clear_screen(self):
-        """Clear the terminal screen"""
-        # Use ANSI escape codes for cross-platform compatibility
-        print("\033[2J\033[H", end="")
-
-    def print_banner(self):
-        """Print a cool ASCII banner"""
-        # Bright magenta color
-        MAGENTA = "\033[95m"
-        RESET = "\033[0m"
-        BOLD = "\033[1m"
-
-        banner = f"""{MAGENTA}{BOLD}
+_BANNER = f"""{MAGENTA}{BOLD}
 
  ██████╗██╗      █████╗ ██╗   ██╗██████╗ ███████╗
 ██╔════╝██║     ██╔══██╗██║   ██║██╔══██╗██╔════╝
@@ -58,18 +41,83 @@ class InteractiveUI:
 ███████╗██╔╝ ██╗   ██║   ██║  ██║██║  ██║╚██████╗   ██║
 ╚══════╝╚═╝  ╚═╝   ╚═╝   ╚═╝  ╚═╝╚═╝  ╚═╝ ╚═════╝   ╚═╝
 
-{RESET}"""
-        print(banner)
+{RESET}
+"""
+_BANNER_BYTES = _BANNER.encode("utf-8")
+_CLEAR = b"\033[2J\033[H"
+
+
+def _write_stdout(data: bytes):
+    """Write pre-encoded bytes to stdout in one call, keeping print() ordering"""
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # Replaced stdout (e.g. StringIO) without a binary layer
+        sys.stdout.write(data.decode("utf-8"))
+    else:
+        buffer.write(data)
+    sys.stdout.flush()
+
+
+class InteractiveUI:
+    """Interactive terminal UI for easier conversation extraction"""
+
+    def __init__(self, output_dir: Optional[str] = None):
+        self.output_dir = output_dir
+        self.extractor = ClaudeConversationExtractor(output_dir)
+        self.searcher = ConversationSearcher()
+        self.sessions: List[Path] = []
+        self._typeahead = b""  # Keys read past the end of the last menu choice
+        self.terminal_width = shutil.get_terminal_size().columns
+
+    def show_header(self):
+        """Clear the screen and print the banner in a single write"""
+        _write_stdout(_CLEAR + _BANNER_BYTES)
 
     def print_centered(self, text: str, char: str = "="):
         """Print text centered with decorative characters"""
         padding = (self.terminal_width - len(text) - 2) // 2
         print(f"{char * padding} {text} {char * padding}")
 
+    def read_choice(self, prompt: str) -> str:
+        """Read a single-letter menu choice as soon as the key is pressed.
+
+        Falls back to line input when stdin is not a terminal (pipes, tests).
+        """
+        if not sys.stdin.isatty():
+            return input(prompt).strip().upper()
+
+        print(prompt, end="", flush=True)
+        key = None
+        with KeyboardHandler() as keyboard:
+            keyboard.push_back(self._typeahead)
+            # Ignore Enter, arrows and other non-character keys
+            while not (key and len(key) == 1):
+                key = keyboard.get_key(timeout=0.5)
+            # One read can return several keys (e.g. a pasted "s1,3"); keep
+            # the rest for the next prompt instead of dropping it with the
+            # handler
+            self._typeahead = keyboard.take_pending()
+        print(key)
+        return key.upper()
+
+    def read_line(self, prompt: str) -> str:
+        """Read a line of input, starting with any keys typed ahead of it"""
+        text = self._typeahead.decode("utf-8", "replace")
+        self._typeahead = b""
+
+        for i, char in enumerate(text):
+            if char in "\r\n":
+                # The whole line was already typed
+                self._typeahead = text[i + 1 :].encode("utf-8")
+                print(prompt + text[:i])
+                return text[:i]
+
+        return text + input(prompt + text)
+
     def get_folder_selection(self) -> Optional[Path]:
         """Simple folder selection dialog"""
-        self.clear_screen()
-        self.print_banner()
+        self.show_header()
         print("\n📁 Where would you like to save your conversations?\n")
 
         # Suggest common locations
@@ -104,8 +152,7 @@ class InteractiveUI:
 
     def show_sessions_menu(self) -> List[int]:
         """Display sessions and let user select which to extract"""
-        self.clear_screen()
-        self.print_banner()
+        self.show_header()
 
         # Get all sessions
         print("\n🔍 Finding your Claude conversations...")
@@ -117,55 +164,67 @@ class InteractiveUI:
             input("\nPress Enter to exit...")
             return []
 
-        print(f"\n✅ Found {len(self.sessions)} conversations!\n")
-
-        # Display sessions
-        for i, session_path in enumerate(self.sessions[:20], 1):  # Show max 20
-            project = session_path.parent.name
-            modified = datetime.fromtimestamp(session_path.stat().st_mtime)
-            size_kb = session_path.stat().st_size / 1024
-
-            date_str = modified.strftime("%Y-%m-%d %H:%M")
-            print(f"  {i:2d}. [{date_str}] {project[:30]:<30} ({size_kb:.1f} KB)")
-
-        if len(self.sessions) > 20:
-            print(f"\n  ... and {len(self.sessions) - 20} more conversations")
-
-        print("\n" + "=" * 60)
-        print("\nOptions:")
-        print("  A. Extract ALL conversations")
-        print("  R. Extract 5 most RECENT")
-        print("  S. SELECT specific conversations (e.g., 1,3,5)")
-        print("  F. SEARCH conversations (real-time search)")
-        print("  Q. QUIT")
-
         while True:
-            choice = input("\nYour choice: ").strip().upper()
-
-            if choice == "Q":
-                return []
-            elif choice == "A":
-                return list(range(len(self.sessions)))
-            elif choice == "R":
-                return list(range(min(5, len(self.sessions))))
-            elif choice == "S":
-                selection = input("Enter conversation numbers (e.g., 1,3,5): ").strip()
-                try:
-                    indices = [int(x.strip()) - 1 for x in selection.split(",")]
-                    # Validate indices
-                    if all(0 <= i < len(self.sessions) for i in indices):
-                        return indices
-                    else:
-                        print("❌ Invalid selection. Please use valid numbers.")
-                except ValueError:
-                    print("❌ Invalid format. Use comma-separated numbers.")
-            elif choice == "F":
-                # Search functionality
-                search_results = self.search_conversations()
-                if search_results:
-                    return search_results
-            else:
-                print("❌ Invalid choice. Please try again.")
+            print(f"\n✅ Found {len(self.sessions)} conversations!\n")
+
+            # Display sessions
+            for i, session_path in enumerate(self.sessions[:20], 1):  # Show max 20
+                project = session_path.parent.name
+                stat = session_path.stat()
+                modified = time.localtime(stat.st_mtime)
+                size_kb = stat.st_size / 1024
+
+                # Fixed format, so skip strftime's format parsing
+                date_str = (
+                    f"{modified.tm_year:04d}-{modified.tm_mon:02d}-{modified.tm_mday:02d} "
+                    f"{modified.tm_hour:02d}:{modified.tm_min:02d}"
+                )
+                print(f"  {i:2d}. [{date_str}] {project[:30]:<30} ({size_kb:.1f} KB)")
+
+            if len(self.sessions) > 20:
+                print(f"\n  ... and {len(self.sessions) - 20} more conversations")
+
+            print("\n" + "=" * 60)
+            print("\nOptions:")
+            print("  A. Extract ALL conversations")
+            print("  R. Extract 5 most RECENT")
+            print("  S. SELECT specific conversations (e.g., 1,3,5)")
+            print("  F. SEARCH conversations (real-time search)")
+            print("  Q. QUIT")
+
+            while True:
+                choice = self.read_choice("\nYour choice: ")
+
+                if choice == "Q":
+                    return []
+                elif choice == "A":
+                    return list(range(len(self.sessions)))
+                elif choice == "R":
+                    return list(range(min(5, len(self.sessions))))
+                elif choice == "S":
+                    selection = self.read_line(
+                        "Enter conversation numbers (e.g., 1,3,5): "
+                    ).strip()
+                    try:
+                        indices = [int(x.strip()) - 1 for x in selection.split(",")]
+                        # Validate indices
+                        if all(0 <= i < len(self.sessions) for i in indices):
+                            return indices
+                        else:
+                            print("❌ Invalid selection. Please use valid numbers.")
+                    except ValueError:
+                        print("❌ Invalid format. Use comma-separated numbers.")
+                elif choice == "F":
+                    # Search functionality
+                    search_results = self.search_conversations()
+                    if search_results:
+                        return search_results
+                    # The search UI cleared the screen; redraw the menu from
+                    # the sessions already loaded instead of rescanning disk
+                    self.show_header()
+                    break
+                else:
+                    print("❌ Invalid choice. Please try again.")
 
     def show_progress(self, current: int, total: int, message: str = ""):
         """Display a simple progress bar"""
@@ -221,15 +280,24 @@ class InteractiveUI:
         )
         return success_count
 
+    def _launch_detached(self, command: List[str]):
+        """Start a helper process without waiting for it to exit"""
+        subprocess.Popen(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
     def open_folder(self, path: Path):
         """Open the output folder in the system file explorer"""
         try:
             if platform.system() == "Windows":
                 os.startfile(str(path))
             elif platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", str(path)])
+                self._launch_detached(["open", str(path)])
             else:  # Linux
-                subprocess.run(["xdg-open", str(path)])
+                self._launch_detached(["xdg-open", str(path)])
         except Exception:
             pass  # Silently fail if we can't open the folder
 
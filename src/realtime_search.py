@@ -4,23 +4,28 @@ Fixed real-time search interface for Claude Conversation Extractor.
 Properly handles arrow keys without printing escape sequences.
 """
 
+import heapq
 import os
 import sys
 import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # Platform-specific imports for keyboard handling
 if sys.platform == "win32":
     import msvcrt
 else:
-    import select
+    import selectors
     import termios
     import tty
 
+# Characters that make a query worth trying as a regular expression
+_REGEX_META = frozenset(r".*+?[]{}()^$|\\")
+
 
 @dataclass
 class SearchState:
@@ -30,7 +35,7 @@ class SearchState:
     cursor_pos: int = 0
     results: List = None
     selected_index: int = 0
-    last_update: float = 0
+    last_update: float = 0  # time.monotonic() of the last query edit
     is_searching: bool = False
 
     def __post_init__(self):
@@ -41,8 +46,26 @@ class SearchState:
 class KeyboardHandler:
     """Cross-platform keyboard input handler with fixed arrow key support"""
 
+    # Escape sequences sent by the arrow keys
+    ARROW_KEYS = {
+        b"\x1b[A": "UP",
+        b"\x1b[B": "DOWN",
+        b"\x1b[C": "RIGHT",
+        b"\x1b[D": "LEFT",
+        # Sent instead in the terminal's application cursor mode
+        b"\x1bOA": "UP",
+        b"\x1bOB": "DOWN",
+        b"\x1bOC": "RIGHT",
+        b"\x1bOD": "LEFT",
+    }
+    READ_SIZE = 32  # Bytes requested per read of stdin
+    ESC_TIMEOUT = 0.05  # Wait for the rest of an escape sequence cut off by a read
+
     def __init__(self):
         self.old_settings = None
+        self._selector = None
+        self._pending = b""  # Bytes read from stdin but not yet returned
+        self._drained = True  # Whether the last read emptied the input queue
         if sys.platform != "win32":
             self.stdin_fd = sys.stdin.fileno()
 
@@ -57,13 +80,25 @@ class KeyboardHandler:
         """Restore terminal settings"""
         if sys.platform != "win32" and self.old_settings:
             termios.tcsetattr(self.stdin_fd, termios.TCSADRAIN, self.old_settings)
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+
+    def take_pending(self) -> bytes:
+        """Remove and return input that was read but not yet returned as keys"""
+        data, self._pending = self._pending, b""
+        return data
+
+    def push_back(self, data: bytes):
+        """Queue bytes to be returned as keys before reading stdin again"""
+        self._pending = data + self._pending
 
     def get_key(self, timeout: float = 0.1) -> Optional[str]:
         """Get a single keypress with timeout - FIXED version"""
         if sys.platform == "win32":
             # Windows implementation
-            start_time = time.time()
-            while time.time() - start_time < timeout:
+            start_time = time.monotonic()
+            while time.monotonic() - start_time < timeout:
                 if msvcrt.kbhit():
                     key = msvcrt.getch()
                     # Handle special keys
@@ -91,151 +126,300 @@ class KeyboardHandler:
                 time.sleep(0.01)
             return None
         else:
-            # Unix/Linux/macOS implementation - FIXED
-            if select.select([sys.stdin], [], [], timeout)[0]:
-                # Read one character
-                char = sys.stdin.read(1)
-                
-                # Check for escape sequences
-                if char == '\x1b':  # ESC character
-                    # Check if there are more characters (arrow key sequence)
-                    if select.select([sys.stdin], [], [], 0.0)[0]:
-                        # Read the rest of the escape sequence
-                        seq = []
-                        seq.append(sys.stdin.read(1))  # Should be '['
-                        
-                        # Read the next character
-                        if select.select([sys.stdin], [], [], 0.0)[0]:
-                            seq.append(sys.stdin.read(1))
-                            
-                            # Check for arrow keys
-                            if seq == ['[', 'A']:
-                                return "UP"
-                            elif seq == ['[', 'B']:
-                                return "DOWN"
-                            elif seq == ['[', 'C']:
-                                return "RIGHT"
-                            elif seq == ['[', 'D']:
-                                return "LEFT"
-                            else:
-                                # Unknown escape sequence - consume any remaining chars
-                                while select.select([sys.stdin], [], [], 0.0)[0]:
-                                    sys.stdin.read(1)
-                                return None
-                        return None
-                    else:
-                        # Just ESC by itself
-                        return "ESC"
-                        
-                elif char == '\r' or char == '\n':
-                    return "ENTER"
-                elif char == '\x7f' or char == '\x08':
-                    return "BACKSPACE"
-                elif char == '\x03':  # Ctrl+C
-                    raise KeyboardInterrupt
-                elif ord(char) >= 32 and ord(char) < 127:  # Printable characters
-                    return char
-                else:
+            # Unix/Linux/macOS implementation
+            if not self._pending:
+                if not self._wait(timeout):
                     return None
+                # Read everything available in one call; escape sequences and
+                # typeahead are parsed from the buffer without more syscalls
+                self._read()
+            # A read can end inside an escape sequence; fetch the rest of it
+            # so its tail isn't taken for typed text
+            while self._partial_escape() and self._wait(self.ESC_TIMEOUT):
+                if not self._read():
+                    break
+            return self._next_key()
+
+    def _wait(self, timeout: float) -> bool:
+        """Wait up to timeout for stdin to become readable"""
+        if self._selector is None:
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self.stdin_fd, selectors.EVENT_READ)
+        return bool(self._selector.select(timeout))
+
+    def _read(self) -> bytes:
+        """Append one read of stdin to the pending bytes and return it"""
+        data = os.read(self.stdin_fd, self.READ_SIZE)
+        self._drained = len(data) < self.READ_SIZE
+        self._pending += data
+        return data
+
+    def _partial_escape(self) -> bool:
+        """Whether the pending bytes start with an unfinished escape sequence"""
+        data = self._pending
+        if data[:1] != b"\x1b":
+            return False
+        if len(data) == 1:
+            # A lone ESC is the key itself unless a full read cut it off
+            return not self._drained
+        if data[1:2] == b"[":
+            return not any(0x40 <= byte <= 0x7E for byte in data[2:])
+        if data[1:2] == b"O":
+            return len(data) < 3
+        return False
+
+    def _next_key(self) -> Optional[str]:
+        """Consume one key from the pending input bytes"""
+        data = self._pending
+        if not data:
             return None
 
+        if data[:1] == b"\x1b":  # ESC character
+            if len(data) == 1:
+                # Just ESC by itself
+                self._pending = b""
+                return "ESC"
+            if data[1:2] == b"[":
+                # CSI sequence: parameter bytes up to a final byte in @..~
+                end = 2
+                while end < len(data) and not 0x40 <= data[end] <= 0x7E:
+                    end += 1
+                self._pending = data[end + 1 :]
+                return self.ARROW_KEYS.get(data[: end + 1])
+            if data[1:2] == b"O":
+                # SS3 sequence (F1-F4, arrows): always one more byte
+                self._pending = data[3:]
+                return self.ARROW_KEYS.get(data[:3])
+            # Unknown escape sequence
+            self._pending = data[2:]
+            return None
+
+        self._pending = data[1:]
+        char = data[0]
+        if char in (0x0D, 0x0A):  # \r or \n
+            return "ENTER"
+        elif char in (0x7F, 0x08):
+            return "BACKSPACE"
+        elif char == 0x03:  # Ctrl+C
+            raise KeyboardInterrupt
+        elif 32 <= char < 127:  # Printable characters
+            return chr(char)
+        return None
+
 
 class TerminalDisplay:
-    """Manages terminal display for real-time search"""
+    """Manages terminal display for real-time search
+
+    Output is collected in a byte buffer and written to the terminal with a
+    single call per frame. draw_search_box() ends a frame and flushes it.
+    """
+
+    # Static pieces are encoded once instead of on every redraw
+    HEADER = (
+        "🔍 REAL-TIME SEARCH\n"
+        + "=" * 60
+        + "\n"
+        + "Type to search • ↑↓ to select • Enter to open • ESC to exit\n"
+        + "─" * 60
+        + "\n"
+    ).encode("utf-8")
+    SEPARATOR = ("─" * 60).encode("utf-8")
+    HIGHLIGHT = b"\033[93m"
+    RESET = b"\033[0m"
+    PREVIEW_WIDTH = 60  # Characters of context shown per result
+    PREVIEW_LEAD = 20  # Context kept before a match that would be cut off
 
     def __init__(self):
         self.last_result_count = 0
         self.header_lines = 4  # Lines used by header
+        self._buf = bytearray()
+        self._query_cache = ("", "")
+        self._row_keys: List[tuple] = []
+        self._drawn_results: List = []
+        self._row_info: Dict[int, bytes] = {}
+
+    def write(self, text: str):
+        """Queue text for the current frame"""
+        self._buf += text.encode("utf-8")
+
+    def flush(self):
+        """Write the buffered frame to the terminal in one call"""
+        if not self._buf:
+            return
+        # Keep ordering with anything printed through the text layer
+        sys.stdout.flush()
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is None:
+            # Replaced stdout (e.g. StringIO) without a binary layer
+            sys.stdout.write(self._buf.decode("utf-8"))
+            sys.stdout.flush()
+        else:
+            buffer.write(bytes(self._buf))
+            buffer.flush()
+        self._buf.clear()
 
-    def clear_screen(self):
-        """Clear the terminal screen"""
+    def clear_screen(self, flush: bool = True):
+        """Clear the terminal screen
+
+        With flush=False the clear is left in the frame buffer so it reaches
+        the terminal together with the rest of the frame.
+        """
+        self._row_keys = []
         if sys.platform == "win32":
+            self._buf.clear()
             os.system("cls")
         else:
-            print("\033[2J\033[H", end="")
+            self._buf += b"\033[2J\033[H"
+            if flush:
+                self.flush()
 
     def move_cursor(self, row: int, col: int):
         """Move cursor to specific position"""
-        print(f"\033[{row};{col}H", end="", flush=True)
+        self._buf += b"\033[%d;%dH" % (row, col)
 
     def clear_line(self):
         """Clear current line"""
-        print("\033[2K", end="", flush=True)
+        self._buf += b"\033[2K"
+
+    def clear_to_end(self):
+        """Clear from the cursor to the end of the screen"""
+        self._buf += b"\033[J"
 
     def save_cursor(self):
         """Save current cursor position"""
-        print("\033[s", end="", flush=True)
+        self._buf += b"\033[s"
 
     def restore_cursor(self):
         """Restore saved cursor position"""
-        print("\033[u", end="", flush=True)
+        self._buf += b"\033[u"
 
     def draw_header(self):
         """Draw the search interface header"""
         self.move_cursor(1, 1)
-        print("🔍 REAL-TIME SEARCH")
-        print("=" * 60)
-        print("Type to search • ↑↓ to select • Enter to open • ESC to exit")
-        print("─" * 60)
+        self._buf += self.HEADER
 
     def draw_results(self, results: List, selected_index: int, query: str):
-        """Draw search results with highlighting"""
-        # Clear previous results
-        for i in range(self.last_result_count + 1):
+        """Draw search results, rewriting only the rows that changed"""
+        visible = results[:10]  # Show max 10 results
+
+        # A row's appearance depends only on its result, selection and query
+        if visible:
+            row_keys = [
+                (id(result), i == selected_index, query)
+                for i, result in enumerate(visible)
+            ]
+        else:
+            row_keys = [(None, False, query)]
+
+        for i, key in enumerate(row_keys):
+            if i < len(self._row_keys) and self._row_keys[i] == key:
+                continue
+
             self.move_cursor(self.header_lines + i + 1, 1)
             self.clear_line()
-
-        if not results:
-            self.move_cursor(self.header_lines + 1, 1)
-            if query:
-                print(f"No results found for '{query}'")
+            if visible:
+                self._draw_result_row(visible[i], i == selected_index, query)
+            elif query:
+                self.write(f"No results found for '{query}'\n")
             else:
-                print("Start typing to search...")
+                self._buf += b"Start typing to search...\n"
+
+        # Clear rows left over from a differently sized previous frame in one
+        # go; the search box below is redrawn after the results anyway
+        if len(row_keys) != len(self._row_keys):
+            self.move_cursor(self.header_lines + len(row_keys) + 1, 1)
+            self.clear_to_end()
+
+        self._row_keys = row_keys
+        # Keep drawn results alive so their ids can't be reused by new ones
+        self._drawn_results = visible
+        self._row_info = {
+            id(r): self._row_info[id(r)] for r in visible if id(r) in self._row_info
+        }
+        self.last_result_count = len(visible)
+
+    def _draw_result_row(self, result, is_selected: bool, query: str):
+        """Draw a single result line at the current cursor position"""
+        if is_selected:
+            self._buf += "▸ ".encode("utf-8")  # Selection indicator
         else:
-            # Display results
-            for i, result in enumerate(results[:10]):  # Show max 10 results
-                self.move_cursor(self.header_lines + i + 1, 1)
-
-                # Format result display
-                if i == selected_index:
-                    print("▸ ", end="")  # Selection indicator
-                else:
-                    print("  ", end="")
-
-                # Show result info
-                date_str = result.timestamp.strftime("%Y-%m-%d")
-                project = Path(result.file_path).parent.name[:20]
-
-                # Highlight matching text
-                preview = result.context[:60].replace("\n", " ")
-                if query.lower() in preview.lower():
-                    # Simple highlighting - could be improved
-                    idx = preview.lower().find(query.lower())
-                    preview = (
-                        preview[:idx]
-                        + f"\033[93m{preview[idx:idx + len(query)]}\033[0m"
-                        + preview[idx + len(query) :]
-                    )
-
-                print(f"📄 {date_str} | {project} | {preview}...")
-
-        self.last_result_count = len(results[:10])
+            self._buf += b"  "
+
+        # Date and project never change for a result, so format them once
+        info = self._row_info.get(id(result))
+        if info is None:
+            info = self._row_info[id(result)] = self._format_row_info(result)
+
+        self._buf += info
+        self._write_runs(self._format_preview(result.context, query))
+        self._buf += b"...\n"
+
+    def _format_row_info(self, result) -> bytes:
+        """Encode the date and project columns shown before a result preview"""
+        if result.timestamp:
+            date_str = result.timestamp.strftime("%Y-%m-%d")
+        else:
+            date_str = "Unknown"
+        project = os.path.basename(os.path.dirname(result.file_path))[:20]
+        return f"📄 {date_str} | {project} | ".encode("utf-8")
+
+    def _format_preview(self, text: str, query: str) -> List[Tuple[Optional[bytes], str]]:
+        """Split a result preview into (style, text) runs with the match highlighted
+
+        When the first match falls past the visible width, the preview starts
+        a little before it so the highlighted term is always on screen.
+        """
+        # The query only changes on keystrokes, so lower it once per query
+        # rather than once per result per frame
+        if self._query_cache[0] != query:
+            self._query_cache = (query, query.lower())
+        idx = text.lower().find(self._query_cache[1]) if query else -1
+        end = idx + len(query)
+
+        if idx != -1 and end > self.PREVIEW_WIDTH:
+            start = max(0, idx - self.PREVIEW_LEAD)
+            if start > 0:
+                text = "…" + text[start:]
+                idx, end = idx - start + 1, end - start + 1
+
+        preview = text[: self.PREVIEW_WIDTH].replace("\n", " ")
+        if idx == -1:
+            return [(None, preview)]
+
+        return [
+            (None, preview[:idx]),
+            (self.HIGHLIGHT, preview[idx:end]),
+            (None, preview[end:]),
+        ]
+
+    def _write_runs(self, runs: List[Tuple[Optional[bytes], str]]):
+        """Write styled runs, emitting SGR codes only when the style changes"""
+        current = None
+        for style, text in runs:
+            if not text:
+                continue
+            if style != current:
+                self._buf += style if style else self.RESET
+                current = style
+            self.write(text)
+        if current is not None:
+            self._buf += self.RESET
 
     def draw_search_box(self, query: str, cursor_pos: int):
-        """Draw the search input box"""
+        """Draw the search input box and flush the frame"""
         # Position at bottom of results
         row = self.header_lines + self.last_result_count + 3
         self.move_cursor(row, 1)
         self.clear_line()
-        print("─" * 60)
+        self._buf += self.SEPARATOR + b"\n"
 
         self.move_cursor(row + 1, 1)
         self.clear_line()
-        print(f"Search: {query}", end="")
+        self.write(f"Search: {query}")
 
         # Position cursor
         self.move_cursor(row + 1, 9 + cursor_pos)
-        sys.stdout.flush()
+        self.flush()
 
 
 class RealTimeSearch:
@@ -248,9 +432,12 @@ class RealTimeSearch:
         self.state = SearchState()
         self.search_thread = None
         self.search_lock = threading.Lock()
-        self.results_cache = {}
+        self.results_cache: "OrderedDict[str, List]" = OrderedDict()
+        self.max_cache = 64  # Queries kept in the LRU results cache
         self.debounce_delay = 0.3  # 300ms debounce
         self.stop_event = threading.Event()  # For clean thread shutdown
+        self._search_event = threading.Event()  # Set when a search is requested
+        self._search_generation = 0  # Bumped on every keystroke that searches
 
     def _process_search_request(self):
         """Process a single search request (extracted for testing)"""
@@ -259,10 +446,11 @@ class RealTimeSearch:
                 return False
 
             # Check debounce
-            if time.time() - self.state.last_update < self.debounce_delay:
+            if time.monotonic() - self.state.last_update < self.debounce_delay:
                 return False
 
             query = self.state.query
+            generation = self._search_generation
             self.state.is_searching = False
 
         if not query:
@@ -272,10 +460,19 @@ class RealTimeSearch:
 
         # Check cache
         if query in self.results_cache:
+            self.results_cache.move_to_end(query)
             with self.search_lock:
                 self.state.results = self.results_cache[query]
             return True
 
+        # Extending a query whose search found nothing can't find anything
+        if self._has_empty_prefix(query):
+            self._cache_results(query, [])
+            with self.search_lock:
+                self.state.results = []
+                self.state.selected_index = 0
+            return True
+
         # Perform search
         try:
             # Allow search_dir to be set on instance for testing
@@ -291,9 +488,12 @@ class RealTimeSearch:
             results = self.searcher.search(**search_kwargs)
 
             # Cache results
-            self.results_cache[query] = results
+            self._cache_results(query, results)
 
             with self.search_lock:
+                # Drop results the user has already typed past
+                if generation != self._search_generation:
+                    return True
                 self.state.results = results
                 self.state.selected_index = 0
         except Exception:
@@ -303,12 +503,48 @@ class RealTimeSearch:
 
         return True
 
+    def _cache_results(self, query: str, results: List):
+        """Cache results for a query, evicting the least recently used entry"""
+        self.results_cache[query] = results
+        self.results_cache.move_to_end(query)
+        while len(self.results_cache) > self.max_cache:
+            self.results_cache.popitem(last=False)
+
+    def _has_empty_prefix(self, query: str) -> bool:
+        """Check whether a cached prefix of a single-word query had no matches.
+
+        For a plain word every match must contain the word, so it must also
+        contain any prefix of it. That stops holding once the query has
+        several words, regex characters, or semantic matching is enabled.
+        """
+        if (
+            len(query.split()) != 1
+            or not _REGEX_META.isdisjoint(query)
+            or getattr(self.searcher, "nlp", None)
+        ):
+            return False
+
+        return any(
+            query.startswith(prefix) and not results
+            for prefix, results in self.results_cache.items()
+        )
+
     def search_worker(self):
         """Background thread for searching"""
         while not self.stop_event.is_set():
-            # Wait for search request
-            time.sleep(0.05)
-            self._process_search_request()
+            # Sleep until a keystroke requests a search instead of polling
+            if not self._search_event.wait(timeout=0.5):
+                continue
+            self._search_event.clear()
+
+            # Let the debounce window pass; typing more re-arms the event
+            with self.search_lock:
+                remaining = self.debounce_delay - (time.monotonic() - self.state.last_update)
+            if remaining > 0 and self.stop_event.wait(remaining):
+                break
+            if not self._process_search_request() and self.state.is_searching:
+                # Woke fractionally early inside the debounce window; retry
+                self._search_event.set()
 
         # Thread cleanup
         self.stop_event.clear()
@@ -374,23 +610,27 @@ class RealTimeSearch:
     def trigger_search(self):
         """Trigger a new search with debouncing"""
         with self.search_lock:
-            self.state.last_update = time.time()
+            self.state.last_update = time.monotonic()
             self.state.is_searching = True
-            # Clear cache for partial matches
-            keys_to_remove = [
-                k
-                for k in self.results_cache.keys()
-                if not k.startswith(self.state.query)
-            ]
-            for k in keys_to_remove:
-                del self.results_cache[k]
+            self._search_generation += 1
+        self._search_event.set()
 
     def stop(self):
         """Stop the search worker thread cleanly"""
         if self.search_thread and self.search_thread.is_alive():
             self.stop_event.set()
+            self._search_event.set()  # Wake the worker so it sees the stop
             self.search_thread.join(timeout=0.5)
 
+    def _frame_key(self) -> tuple:
+        """Everything the drawn results and search box depend on"""
+        return (
+            self.state.results[:10],
+            self.state.selected_index,
+            self.state.query,
+            self.state.cursor_pos,
+        )
+
     def run(self) -> Optional[Path]:
         """Run the real-time search interface"""
         # Start search worker thread
@@ -398,11 +638,11 @@ class RealTimeSearch:
         self.search_thread.start()
 
         try:
-            self.display.clear_screen()
-            self.display.draw_header()
-
             with KeyboardHandler() as keyboard:
-                # Initial draw
+                # Initial frame: clear, header, results and search box go
+                # out in a single write when the search box flushes
+                self.display.clear_screen(flush=False)
+                self.display.draw_header()
                 self.display.draw_results(
                     self.state.results[:10],
                     self.state.selected_index,
@@ -412,11 +652,15 @@ class RealTimeSearch:
                     self.state.query, self.state.cursor_pos
                 )
                 
+                last_frame = self._frame_key()
+
                 while True:
                     # Get keyboard input
                     key = keyboard.get_key(timeout=0.1)
-                    
-                    if key:
+
+                    # Apply every key already waiting (typeahead, pastes)
+                    # before redrawing once for the whole burst
+                    while key:
                         action = self.handle_input(key)
 
                         if action == "exit":
@@ -426,20 +670,23 @@ class RealTimeSearch:
                                 self.state.selected_index
                             ]
                             return selected_result.file_path
-                        elif action == "redraw" or action is None:
-                            # Redraw the interface
-                            self.display.draw_results(
-                                self.state.results[:10],
-                                self.state.selected_index,
-                                self.state.query,
-                            )
-                            self.display.draw_search_box(
-                                self.state.query, self.state.cursor_pos
-                            )
-                    else:
-                        # Check if results have changed (from search thread)
-                        # and redraw if needed
-                        pass
+
+                        key = keyboard.get_key(timeout=0)
+
+                    # Redraw only when the frame would differ: a key changed
+                    # the query, cursor or selection, or the search thread
+                    # delivered new results
+                    frame = self._frame_key()
+                    if frame != last_frame:
+                        last_frame = frame
+                        self.display.draw_results(
+                            self.state.results[:10],
+                            self.state.selected_index,
+                            self.state.query,
+                        )
+                        self.display.draw_search_box(
+                            self.state.query, self.state.cursor_pos
+                        )
 
         except KeyboardInterrupt:
             return None
@@ -449,6 +696,22 @@ class RealTimeSearch:
             self.display.clear_screen()
 
 
+class SmartSearcher:
+    """A searcher whose search() is the smart search of create_smart_searcher
+
+    Other attributes are read from the wrapped searcher. Wrapping instead of
+    replacing searcher.search keeps this working when ConversationSearcher
+    is compiled with mypyc, whose instances don't allow it.
+    """
+
+    def __init__(self, searcher, search):
+        self.searcher = searcher
+        self.search = search
+
+    def __getattr__(self, name):
+        return getattr(self.searcher, name)
+
+
 def create_smart_searcher(searcher):
     """Enhance the searcher with smart search capabilities"""
     original_search = searcher.search
@@ -458,64 +721,66 @@ def create_smart_searcher(searcher):
         # Remove mode parameter if provided
         kwargs.pop("mode", None)
 
+        max_results = kwargs.get("max_results", 20)
+
         # Try different search strategies
         results = []
+        existing_paths = set()
+
+        def add_new_files(mode_results):
+            """Add results from files no earlier strategy matched"""
+            for r in mode_results:
+                if r.file_path not in existing_paths:
+                    results.append(r)
+                    existing_paths.add(r.file_path)
 
         # 1. First try exact match (fast)
         exact_results = original_search(query, mode="exact", **kwargs)
         results.extend(exact_results)
+        existing_paths.update(r.file_path for r in exact_results)
 
         # 2. If query looks like regex, try regex search
-        if any(c in query for c in r".*+?[]{}()^$|\\"):
+        if not _REGEX_META.isdisjoint(query):
             try:
-                regex_results = original_search(query, mode="regex", **kwargs)
-                # Add results not already found
-                existing_paths = {r.file_path for r in results}
-                for r in regex_results:
-                    if r.file_path not in existing_paths:
-                        results.append(r)
+                add_new_files(original_search(query, mode="regex", **kwargs))
             except Exception:
                 pass  # Invalid regex, skip
 
         # 3. Smart search for partial matches
-        smart_results = original_search(query, mode="smart", **kwargs)
-        existing_paths = {r.file_path for r in results}
-        for r in smart_results:
-            if r.file_path not in existing_paths:
-                results.append(r)
-
-        # 4. If semantic search is available, use it for better matches
-        if hasattr(searcher, "nlp") and searcher.nlp:
+        add_new_files(original_search(query, mode="smart", **kwargs))
+
+        # 4. If semantic search is available, use it for better matches,
+        # unless the cheaper strategies already filled the result list
+        if (
+            len(results) < max_results
+            and hasattr(searcher, "nlp")
+            and searcher.nlp
+        ):
             try:
-                semantic_results = original_search(query, mode="semantic", **kwargs)
-                existing_paths = {r.file_path for r in results}
-                for r in semantic_results:
-                    if r.file_path not in existing_paths:
-                        results.append(r)
+                add_new_files(original_search(query, mode="semantic", **kwargs))
             except Exception:
                 pass  # Semantic search failed
 
-        # Sort by relevance (timestamp for now, could be improved)
+        # Keep the newest max_results (timestamp for now, could be improved)
+        # without sorting the whole merged list
         try:
-            results.sort(
-                key=lambda x: x.timestamp if x.timestamp else datetime.min, reverse=True
+            return heapq.nlargest(
+                max_results,
+                results,
+                key=lambda x: x.timestamp if x.timestamp else datetime.min,
             )
         except (AttributeError, TypeError):
-            # If timestamp comparison fails, sort by relevance score
+            # If timestamp comparison fails, rank by relevance score
             try:
-                results.sort(
-                    key=lambda x: getattr(x, "relevance_score", 0), reverse=True
+                return heapq.nlargest(
+                    max_results,
+                    results,
+                    key=lambda x: getattr(x, "relevance_score", 0),
                 )
             except Exception:
-                pass  # Keep original order if sorting fails
-
-        # Limit results
-        max_results = kwargs.get("max_results", 20)
-        return results[:max_results]
+                return results[:max_results]  # Keep original order
 
-    # Replace the search method
-    searcher.search = smart_search
-    return searcher
+    return SmartSearcher(searcher, smart_search)
 
 
 def main():
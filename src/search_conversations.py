@@ -13,11 +13,37 @@ Adapted from CAKE's conversation parser for Claude conversation search.
 """
 
 import json
+import os
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Pattern, Set, Tuple
+
+# The regex parser moved under re in Python 3.11
+try:
+    from re import _parser as _sre_parse  # type: ignore
+except ImportError:
+    import sre_parse as _sre_parse  # type: ignore
+
+# orjson is optional; it decodes JSONL lines (as bytes) several times faster
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore
+
+# setup.py passes --always-false=_IN_PACKAGE to mypyc, which compiles the
+# installed top-level module and can't build the relative import
+_IN_PACKAGE = bool(__package__)
+if _IN_PACKAGE:
+    from .index_builder import TrigramIndex, prune_indexes  # type: ignore
+else:
+    # Direct execution or installed as a top-level module
+    from index_builder import TrigramIndex, prune_indexes
 
 # Optional NLP imports for semantic search
 try:
@@ -30,6 +56,198 @@ except ImportError:
     print("      pip install spacy && python -m spacy download en_core_web_sm")
 
 
+# A searchable message: (line_number, speaker, content, lowercased content,
+# timestamp string). The lowercased copy serves every case-insensitive search
+Message = Tuple[int, str, str, str, Optional[str]]
+
+# Parsed messages per file path: (mtime_ns, size, total chars, messages),
+# least recently used first. Total chars counts both copies of the text
+_TEXT_CACHE: "OrderedDict[str, Tuple[int, int, int, List[Message]]]" = OrderedDict()
+_TEXT_CACHE_LOCK = threading.Lock()
+_TEXT_CACHE_MAX_FILES = 2000
+_TEXT_CACHE_MAX_CHARS = 100_000_000
+_text_cache_chars = 0
+
+
+def _cached_conversation(key: str, stat: os.stat_result) -> Optional[List[Message]]:
+    """Return cached messages for a file if it hasn't changed since parsing."""
+    with _TEXT_CACHE_LOCK:
+        cached = _TEXT_CACHE.get(key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            _TEXT_CACHE.move_to_end(key)
+            return cached[3]
+    return None
+
+
+def _cache_conversation(key: str, entry: Tuple[int, int, int, List[Message]]) -> None:
+    """Store parsed messages, evicting the least recently used files."""
+    global _text_cache_chars
+
+    with _TEXT_CACHE_LOCK:
+        old = _TEXT_CACHE.pop(key, None)
+        if old:
+            _text_cache_chars -= old[2]
+        _TEXT_CACHE[key] = entry
+        _text_cache_chars += entry[2]
+
+        while len(_TEXT_CACHE) > 1 and (
+            len(_TEXT_CACHE) > _TEXT_CACHE_MAX_FILES
+            or _text_cache_chars > _TEXT_CACHE_MAX_CHARS
+        ):
+            _, evicted = _TEXT_CACHE.popitem(last=False)
+            _text_cache_chars -= evicted[2]
+
+
+# Files up to this size are read in one call; larger ones are streamed
+_SLURP_LIMIT = 1024 * 1024
+# Read buffer for streamed files, well above io's 8KB default
+_JSONL_BUF = 128 * 1024
+
+
+def _read_entries(jsonl_file: Path, size: int) -> Iterator[Tuple[int, object]]:
+    """Yield (line number, decoded JSON) for each valid line of a JSONL file."""
+    if size <= _SLURP_LIMIT:
+        # Small files are consumed whole, so skip the buffered stream and
+        # decode every line as one JSON array, one call instead of one per line
+        numbered = [
+            (line_num, line)
+            for line_num, line in enumerate(jsonl_file.read_bytes().splitlines(), 1)
+            if line.strip()
+        ]
+        try:
+            entries = json_loads(b"[" + b",".join(line for _, line in numbered) + b"]")
+        except ValueError:
+            entries = None  # A malformed line; find it below
+        # Lines that aren't one complete value each can still join into a
+        # valid array, so only trust the batch if it has an entry per line
+        if entries is not None and len(entries) == len(numbered):
+            for (line_num, _), entry in zip(numbered, entries):
+                yield line_num, entry
+            return
+        lines: Iterable[Tuple[int, bytes]] = numbered
+    else:
+        # Stream large sessions so the whole file is never held twice, with
+        # a larger buffer to cut the number of read calls
+        lines = _stream_lines(jsonl_file)
+
+    for line_num, line in lines:
+        try:
+            yield line_num, json_loads(line)
+        except ValueError:
+            continue  # Malformed JSON or invalid UTF-8
+
+
+def _stream_lines(jsonl_file: Path) -> Iterator[Tuple[int, bytes]]:
+    """Yield the numbered raw lines of a file through a large read buffer."""
+    with open(jsonl_file, "rb", buffering=_JSONL_BUF) as f:
+        yield from enumerate(f, 1)
+
+
+def _iter_jsonl(root: Path) -> Iterator[Path]:
+    """
+    Yield the .jsonl files under root, like root.rglob("*.jsonl").
+
+    Walks with os.scandir so directory entries are tested with their cached
+    type instead of a Path object and stat per entry. Symlinked directories
+    aren't followed and unreadable directories are skipped, as with rglob.
+    """
+    stack = [str(root)]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.name.endswith(".jsonl"):
+                        try:
+                            if entry.is_file():
+                                yield Path(entry.path)
+                        except OSError:
+                            pass
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                    except OSError:
+                        pass
+        except OSError:
+            continue
+        # Visit subdirectories in listing order, depth first
+        stack.extend(reversed(subdirs))
+
+
+def _regex_needle(pattern: str, case_sensitive: bool) -> Optional[bytes]:
+    """
+    Find a literal that any match of pattern must contain in the raw JSONL.
+
+    Takes the longest run of plain characters at the top level of the
+    pattern, keeping only ASCII that JSON writers never escape. Runs stop at
+    spaces, since list content parts are joined with one before matching.
+    When matching ignores case, i, k and s are dropped too, because re also
+    matches them against non-ASCII letters. Returns the lowercased literal,
+    or None when nothing of at least three characters qualifies.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern, 0 if case_sensitive else re.IGNORECASE)
+        if parsed.state.flags & re.IGNORECASE:
+            case_sensitive = False
+        items = list(parsed)
+    except Exception:
+        return None
+
+    unsafe = "\"\\/<>&'" if case_sensitive else "\"\\/<>&'iksIKS"
+    best = ""
+    run = ""
+    for op, av in items:
+        char = chr(av) if op is _sre_parse.LITERAL else ""
+        if char and " " < char <= "~" and char not in unsafe:
+            run += char
+            if len(run) > len(best):
+                best = run
+        else:
+            run = ""
+
+    return best.lower().encode("ascii") if len(best) >= 3 else None
+
+
+def _raw_contains(jsonl_file: Path, needle: bytes) -> bool:
+    """Whether the ASCII-lowercased bytes of a file contain needle."""
+    tail = b""
+    with open(jsonl_file, "rb") as f:
+        while True:
+            chunk = f.read(_JSONL_BUF)
+            if not chunk:
+                return False
+            data = tail + chunk.lower()
+            if needle in data:
+                return True
+            tail = data[len(data) - len(needle) + 1 :]
+
+
+# Characters with special meaning in a regex; patterns without any of them
+# match literally
+_REGEX_META = frozenset(r".*+?[]{}()^$|\\")
+
+
+def _may_contain(jsonl_file: Path, needle: bytes) -> bool:
+    """
+    Whether a file is parsed already or its raw bytes contain needle.
+
+    Files that can't be read are kept, so the per-file search reports them
+    the same way as any other unreadable file.
+    """
+    try:
+        if _cached_conversation(str(jsonl_file), jsonl_file.stat()) is not None:
+            return True
+        return _raw_contains(jsonl_file, needle)
+    except OSError:
+        return True
+
+
+@lru_cache(maxsize=256)
+def _compile(pattern: str, flags: int) -> Pattern:
+    """Compile a regex once per (pattern, flags) across files and searches."""
+    return re.compile(pattern, flags)
+
+
 @dataclass
 class SearchResult:
     """Represents a search result with context"""
@@ -72,6 +290,12 @@ class ConversationSearcher:
         self.cache_dir = cache_dir or Path.home() / ".claude" / ".search_cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+        # Trigram indexes of searched directories, loaded on first use
+        self._indexes: Dict[Path, TrigramIndex] = {}
+
+        # Worker threads for scanning files, started on first search
+        self._executor: Optional[ThreadPoolExecutor] = None
+
         # Initialize NLP if available
         self.nlp = None
         if SPACY_AVAILABLE:
@@ -165,33 +389,50 @@ class ConversationSearcher:
             return []
 
         # Find all JSONL files
-        jsonl_files = list(search_dir.rglob("*.jsonl"))
+        jsonl_files = list(_iter_jsonl(search_dir))
         if not jsonl_files:
             return []
 
-        # Apply date filtering to files if provided
-        if date_from or date_to:
+        # Apply date filtering first; it only needs a stat per file
+        date_filtered = bool(date_from or date_to)
+        if date_filtered:
             jsonl_files = self._filter_files_by_date(jsonl_files, date_from, date_to)
 
-        # Search based on mode
-        all_results = []
+        # Skip files the trigram index rules out
+        jsonl_files = self._index_candidates(
+            search_dir,
+            jsonl_files,
+            query,
+            mode,
+            case_sensitive,
+            complete=not date_filtered,
+        )
 
-        for jsonl_file in jsonl_files:
-            if mode == "regex":
-                results = self._search_regex(
-                    jsonl_file, query, speaker_filter, case_sensitive
-                )
-            elif mode == "exact":
-                results = self._search_exact(
-                    jsonl_file, query, speaker_filter, case_sensitive
-                )
-            elif mode == "semantic" and self.nlp:
-                results = self._search_semantic(jsonl_file, query, speaker_filter)
-            else:  # smart mode - combines multiple approaches
-                results = self._search_smart(
-                    jsonl_file, query, speaker_filter, case_sensitive
-                )
+        # Regexes aren't indexed, but most require some literal text; skip
+        # unparsed files whose raw bytes don't contain it
+        if mode == "regex":
+            needle = _regex_needle(query, case_sensitive)
+            if needle:
+                jsonl_files = [f for f in jsonl_files if _may_contain(f, needle)]
+
+        # Search files concurrently so file reads overlap. spaCy pipelines
+        # aren't safe to share across threads, so semantic search stays serial
+        search_file = partial(
+            self._search_file,
+            query=query,
+            mode=mode,
+            speaker_filter=speaker_filter,
+            case_sensitive=case_sensitive,
+        )
+        if len(jsonl_files) > 1 and not (mode == "semantic" and self.nlp):
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(thread_name_prefix="search")
+            per_file = self._executor.map(search_file, jsonl_files)
+        else:
+            per_file = map(search_file, jsonl_files)
 
+        all_results = []
+        for results in per_file:
             all_results.extend(results)
 
         # Sort by relevance score
@@ -200,6 +441,78 @@ class ConversationSearcher:
         # Return top results
         return all_results[:max_results]
 
+    def _search_file(
+        self,
+        jsonl_file: Path,
+        query: str,
+        mode: str,
+        speaker_filter: Optional[str],
+        case_sensitive: bool,
+    ) -> List[SearchResult]:
+        """Search a single file with the given mode."""
+        if mode == "regex":
+            return self._search_regex(jsonl_file, query, speaker_filter, case_sensitive)
+        elif mode == "exact":
+            return self._search_exact(jsonl_file, query, speaker_filter, case_sensitive)
+        elif mode == "semantic" and self.nlp:
+            return self._search_semantic(jsonl_file, query, speaker_filter)
+        else:  # smart mode - combines multiple approaches
+            return self._search_smart(jsonl_file, query, speaker_filter, case_sensitive)
+
+    def _index_candidates(
+        self,
+        search_dir: Path,
+        jsonl_files: List[Path],
+        query: str,
+        mode: str,
+        case_sensitive: bool,
+        complete: bool = True,
+    ) -> List[Path]:
+        """
+        Narrow jsonl_files to those whose text can match the query.
+
+        Exact matches must contain the whole query and smart matches at
+        least one query word, so files missing those trigrams are dropped.
+        Regex and semantic matches can't be narrowed this way. complete is
+        False when jsonl_files has already been filtered, so index entries
+        for the other files are kept.
+        """
+        if mode == "exact":
+            terms = [query]
+        elif mode == "smart" or (mode == "semantic" and not self.nlp):
+            words = query.split() if case_sensitive else query.lower().split()
+            terms = list(set(words) - self.stop_words) or [query]
+        else:
+            return jsonl_files
+
+        index = self._indexes.get(search_dir)
+        if index is None:
+            if not self._indexes:
+                # Drop indexes left behind by directories that were removed
+                prune_indexes(self.cache_dir)
+            index = self._indexes[search_dir] = TrigramIndex(
+                search_dir, self.cache_dir
+            )
+        index.update(jsonl_files, self._iter_message_texts, prune=complete)
+
+        candidates: Set[str] = set()
+        for term in terms:
+            paths = index.files_containing(term)
+            if paths is None:
+                return jsonl_files  # Term too short to narrow anything
+            candidates |= paths
+
+        return [
+            f
+            for f in jsonl_files
+            if str(f) in candidates or not index.is_indexed(f)
+        ]
+
+    def _iter_message_texts(self, jsonl_file: Path) -> Iterator[str]:
+        """Yield the text of every user and assistant message in a file."""
+        for _, _, content, _, _ in self._load_conversation(jsonl_file):
+            yield content
+
     def _filter_files_by_date(
         self,
         files: List[Path],
@@ -207,17 +520,14 @@ class ConversationSearcher:
         date_to: Optional[datetime],
     ) -> List[Path]:
         """Filter files by modification date."""
-        filtered = []
+        # Compare raw timestamps rather than building a datetime per file
+        lower = date_from.timestamp() if date_from else float("-inf")
+        upper = date_to.timestamp() if date_to else float("inf")
 
+        filtered = []
         for file in files:
-            file_mtime = datetime.fromtimestamp(file.stat().st_mtime)
-
-            if date_from and file_mtime < date_from:
-                continue
-            if date_to and file_mtime > date_to:
-                continue
-
-            filtered.append(file)
+            if lower <= file.stat().st_mtime <= upper:
+                filtered.append(file)
 
         return filtered
 
@@ -243,66 +553,40 @@ class ConversationSearcher:
         else:
             query_tokens = set(query.split()) - self.stop_words
 
-        # Read and parse JSONL
         try:
-            with open(jsonl_file, "r", encoding="utf-8") as f:
-                line_num = 0
-                for line in f:
-                    line_num += 1
-                    try:
-                        entry = json.loads(line.strip())
-
-                        # Extract message based on entry type
-                        if entry.get("type") in ["user", "assistant"]:
-                            speaker = (
-                                "human" if entry["type"] == "user" else "assistant"
-                            )
-
-                            # Apply speaker filter
-                            if speaker_filter and speaker != speaker_filter:
-                                continue
-
-                            # Extract content
-                            content = self._extract_content(entry)
-                            if not content:
-                                continue
-
-                            # Calculate relevance
-                            relevance = self._calculate_relevance(
-                                content, query, query_tokens, case_sensitive
-                            )
-
-                            if relevance > 0.1:  # Threshold for inclusion
-                                # Extract context
-                                context = self._extract_context(
-                                    content, query, case_sensitive
-                                )
-
-                                # Parse timestamp if present
-                                timestamp = None
-                                timestamp_str = entry.get("timestamp")
-                                if timestamp_str:
-                                    try:
-                                        timestamp = datetime.fromisoformat(
-                                            timestamp_str.replace("Z", "+00:00")
-                                        )
-                                    except ValueError:
-                                        pass
-
-                                result = SearchResult(
-                                    file_path=jsonl_file,
-                                    conversation_id=conversation_id,
-                                    matched_content=content[:200],
-                                    context=context,
-                                    speaker=speaker,
-                                    timestamp=timestamp,
-                                    relevance_score=relevance,
-                                    line_number=line_num,
-                                )
-                                results.append(result)
+            for (
+                line_num,
+                speaker,
+                content,
+                content_lower,
+                timestamp_str,
+            ) in self._load_conversation(jsonl_file):
+                # Apply speaker filter
+                if speaker_filter and speaker != speaker_filter:
+                    continue
+
+                # Calculate relevance
+                relevance = self._calculate_relevance(
+                    content, query, query_tokens, case_sensitive, content_lower
+                )
 
-                    except json.JSONDecodeError:
-                        continue
+                if relevance > 0.1:  # Threshold for inclusion
+                    # Extract context
+                    context = self._extract_context(
+                        content, query, case_sensitive, content_lower=content_lower
+                    )
+
+                    result = SearchResult(
+                        file_path=jsonl_file,
+                        conversation_id=conversation_id,
+                        matched_content=content[:200],
+                        context=context,
+                        speaker=speaker,
+                        timestamp=self._parse_timestamp(timestamp_str),
+                        relevance_score=relevance,
+                        line_number=line_num,
+                    )
+                    results.append(result)
 
         except Exception as e:
             print(f"Error searching {jsonl_file}: {e}")
@@ -323,63 +607,38 @@ class ConversationSearcher:
         search_query = query if case_sensitive else query.lower()
 
         try:
-            with open(jsonl_file, "r", encoding="utf-8") as f:
-                line_num = 0
-                for line in f:
-                    line_num += 1
-                    try:
-                        entry = json.loads(line.strip())
-
-                        if entry.get("type") in ["user", "assistant"]:
-                            speaker = (
-                                "human" if entry["type"] == "user" else "assistant"
-                            )
-
-                            if speaker_filter and speaker != speaker_filter:
-                                continue
-
-                            content = self._extract_content(entry)
-                            if not content:
-                                continue
-
-                            search_content = (
-                                content if case_sensitive else content.lower()
-                            )
-
-                            if search_query in search_content:
-                                # Calculate relevance based on match frequency
-                                match_count = search_content.count(search_query)
-                                relevance = min(1.0, match_count * 0.2)
-
-                                context = self._extract_context(
-                                    content, query, case_sensitive
-                                )
-
-                                # Parse timestamp if present
-                                timestamp = None
-                                timestamp_str = entry.get("timestamp")
-                                if timestamp_str:
-                                    try:
-                                        timestamp = datetime.fromisoformat(
-                                            timestamp_str.replace("Z", "+00:00")
-                                        )
-                                    except ValueError:
-                                        pass
-
-                                result = SearchResult(
-                                    file_path=jsonl_file,
-                                    conversation_id=conversation_id,
-                                    matched_content=content[:200],
-                                    context=context,
-                                    speaker=speaker,
-                                    timestamp=timestamp,
-                                    relevance_score=relevance,
-                                    line_number=line_num,
-                                )
-                                results.append(result)
-
-                    except json.JSONDecodeError:
-                        continue
+            for (
+                line_num,
+                speaker,
+                content,
+                content_lower,
+                timestamp_str,
+            ) in self._load_conversation(jsonl_file):
+                if speaker_filter and speaker != speaker_filter:
+                    continue
+
+                search_content = content if case_sensitive else content_lower
+
+                if search_query in search_content:
+                    # Calculate relevance based on match frequency
+                    match_count = search_content.count(search_query)
+                    relevance = min(1.0, match_count * 0.2)
+
+                    context = self._extract_context(
+                        content, query, case_sensitive, content_lower=content_lower
+                    )
+
+                    result = SearchResult(
+                        file_path=jsonl_file,
+                        conversation_id=conversation_id,
+                        matched_content=content[:200],
+                        context=context,
+                        speaker=speaker,
+                        timestamp=self._parse_timestamp(timestamp_str),
+                        relevance_score=relevance,
+                        line_number=line_num,
+                    )
+                    results.append(result)
 
         except Exception as e:
             print(f"Error searching {jsonl_file}: {e}")
@@ -400,68 +659,62 @@ class ConversationSearcher:
         # Compile regex pattern
         try:
             flags = 0 if case_sensitive else re.IGNORECASE
-            regex = re.compile(pattern, flags)
+            regex = _compile(pattern, flags)
         except re.error as e:
             print(f"Invalid regex pattern: {e}")
             return []
 
-        try:
-            with open(jsonl_file, "r", encoding="utf-8") as f:
-                line_num = 0
-                for line in f:
-                    line_num += 1
-                    try:
-                        entry = json.loads(line.strip())
-
-                        if entry.get("type") in ["user", "assistant"]:
-                            speaker = (
-                                "human" if entry["type"] == "user" else "assistant"
-                            )
-
-                            if speaker_filter and speaker != speaker_filter:
-                                continue
-
-                            content = self._extract_content(entry)
-                            if not content:
-                                continue
-
-                            matches = list(regex.finditer(content))
-
-                            if matches:
-                                # Calculate relevance based on match quality
-                                relevance = min(1.0, len(matches) * 0.2)
-
-                                # Get context around first match
-                                first_match = matches[0]
-                                start = max(0, first_match.start() - 100)
-                                end = min(len(content), first_match.end() + 100)
-                                context = "..." + content[start:end] + "..."
-
-                                # Parse timestamp if present
-                                timestamp = None
-                                timestamp_str = entry.get("timestamp")
-                                if timestamp_str:
-                                    try:
-                                        timestamp = datetime.fromisoformat(
-                                            timestamp_str.replace("Z", "+00:00")
-                                        )
-                                    except ValueError:
-                                        pass
-
-                                result = SearchResult(
-                                    file_path=jsonl_file,
-                                    conversation_id=conversation_id,
-                                    matched_content=first_match.group(),
-                                    context=context,
-                                    speaker=speaker,
-                                    timestamp=timestamp,
-                                    relevance_score=relevance,
-                                    line_number=line_num,
-                                )
-                                results.append(result)
+        # Plain-text patterns can use str.find, which beats the regex engine.
+        # Ignoring case, that's only equivalent for ASCII text: IGNORECASE
+        # also folds a few non-ASCII letters, and lower() can change lengths
+        literal = _REGEX_META.isdisjoint(pattern)
+        needle = pattern if case_sensitive else pattern.lower()
+        ascii_needle = pattern.isascii()
 
-                    except json.JSONDecodeError:
+        try:
+            for (
+                line_num,
+                speaker,
+                content,
+                content_lower,
+                timestamp_str,
+            ) in self._load_conversation(jsonl_file):
+                if speaker_filter and speaker != speaker_filter:
+                    continue
+
+                if literal and (case_sensitive or (ascii_needle and content.isascii())):
+                    haystack = content if case_sensitive else content_lower
+                    match_start = haystack.find(needle)
+                    if match_start == -1:
                         continue
+                    match_count = haystack.count(needle)
+                    match_end = match_start + len(needle)
+                else:
+                    matches = list(regex.finditer(content))
+                    if not matches:
+                        continue
+                    match_count = len(matches)
+                    match_start, match_end = matches[0].span()
+
+                # Calculate relevance based on match quality
+                relevance = min(1.0, match_count * 0.2)
+
+                # Get context around first match
+                start = max(0, match_start - 100)
+                end = min(len(content), match_end + 100)
+                context = "..." + content[start:end] + "..."
+
+                result = SearchResult(
+                    file_path=jsonl_file,
+                    conversation_id=conversation_id,
+                    matched_content=content[match_start:match_end],
+                    context=context,
+                    speaker=speaker,
+                    timestamp=self._parse_timestamp(timestamp_str),
+                    relevance_score=relevance,
+                    line_number=line_num,
+                )
+                results.append(result)
 
         except Exception as e:
             print(f"Error searching {jsonl_file}: {e}")
@@ -489,66 +742,91 @@ class ConversationSearcher:
         ]
 
         try:
-            with open(jsonl_file, "r", encoding="utf-8") as f:
-                line_num = 0
-                for line in f:
-                    line_num += 1
-                    try:
-                        entry = json.loads(line.strip())
+            for (
+                line_num,
+                speaker,
+                content,
+                content_lower,
+                timestamp_str,
+            ) in self._load_conversation(jsonl_file):
+                if speaker_filter and speaker != speaker_filter:
+                    continue
+
+                # Process content with spaCy
+                content_doc = self.nlp(content_lower)
+
+                # Calculate semantic similarity
+                similarity = self._calculate_semantic_similarity(
+                    query_doc, query_tokens, content_doc
+                )
 
-                        if entry.get("type") in ["user", "assistant"]:
-                            speaker = (
-                                "human" if entry["type"] == "user" else "assistant"
-                            )
+                if similarity > 0.3:  # Threshold for semantic matches
+                    context = self._extract_context(
+                        content, query, False, content_lower=content_lower
+                    )
+
+                    result = SearchResult(
+                        file_path=jsonl_file,
+                        conversation_id=conversation_id,
+                        matched_content=content[:200],
+                        context=context,
+                        speaker=speaker,
+                        timestamp=self._parse_timestamp(timestamp_str),
+                        relevance_score=similarity,
+                        line_number=line_num,
+                    )
+                    results.append(result)
 
-                            if speaker_filter and speaker != speaker_filter:
-                                continue
+        except Exception as e:
+            print(f"Error searching {jsonl_file}: {e}")
 
-                            content = self._extract_content(entry)
-                            if not content:
-                                continue
+        return results
 
-                            # Process content with spaCy
-                            content_doc = self.nlp(content.lower())
+    def _load_conversation(self, jsonl_file: Path) -> List[Message]:
+        """
+        Return the searchable messages of a file, parsing it only when needed.
 
-                            # Calculate semantic similarity
-                            similarity = self._calculate_semantic_similarity(
-                                query_doc, query_tokens, content_doc
-                            )
+        Parsed messages are kept in a process-wide cache keyed by path and
+        validated against the file's mtime and size, so repeated searches
+        skip reading and decoding files that haven't changed.
+        """
+        stat = jsonl_file.stat()
+        key = str(jsonl_file)
+        cached = _cached_conversation(key, stat)
+        if cached is not None:
+            return cached
+
+        messages = []
+        chars = 0
+        for line_num, entry in _read_entries(jsonl_file, stat.st_size):
+            if not isinstance(entry, dict) or entry.get("type") not in [
+                "user",
+                "assistant",
+            ]:
+                continue
 
-                            if similarity > 0.3:  # Threshold for semantic matches
-                                context = self._extract_context(content, query, False)
-
-                                # Parse timestamp if present
-                                timestamp = None
-                                timestamp_str = entry.get("timestamp")
-                                if timestamp_str:
-                                    try:
-                                        timestamp = datetime.fromisoformat(
-                                            timestamp_str.replace("Z", "+00:00")
-                                        )
-                                    except ValueError:
-                                        pass
-
-                                result = SearchResult(
-                                    file_path=jsonl_file,
-                                    conversation_id=conversation_id,
-                                    matched_content=content[:200],
-                                    context=context,
-                                    speaker=speaker,
-                                    timestamp=timestamp,
-                                    relevance_score=similarity,
-                                    line_number=line_num,
-                                )
-                                results.append(result)
+            content = self._extract_content(entry)
+            if not content:
+                continue
 
-                    except json.JSONDecodeError:
-                        continue
+            speaker = "human" if entry["type"] == "user" else "assistant"
+            content_lower = content.lower()
+            messages.append(
+                (line_num, speaker, content, content_lower, entry.get("timestamp"))
+            )
+            chars += len(content) + len(content_lower)
 
-        except Exception as e:
-            print(f"Error searching {jsonl_file}: {e}")
+        _cache_conversation(key, (stat.st_mtime_ns, stat.st_size, chars, messages))
+        return messages
 
-        return results
+    def _parse_timestamp(self, timestamp_str: Optional[str]) -> Optional[datetime]:
+        """Parse an ISO 8601 message timestamp, if present and valid."""
+        if not timestamp_str:
+            return None
+        try:
+            return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+        except (AttributeError, ValueError):
+            return None
 
     def _extract_content(self, entry: Dict) -> str:
         """Extract text content from a JSONL entry."""
@@ -580,7 +858,12 @@ class ConversationSearcher:
         return ""
 
     def _calculate_relevance(
-        self, content: str, query: str, query_tokens: Set[str], case_sensitive: bool
+        self,
+        content: str,
+        query: str,
+        query_tokens: Set[str],
+        case_sensitive: bool,
+        content_lower: Optional[str] = None,
     ) -> float:
         """
         Calculate relevance score for content against query.
@@ -590,12 +873,15 @@ class ConversationSearcher:
         - Token overlap
         - Proximity of terms
         - Match density
+
+        content_lower, when given, is content.lower() computed in advance.
         """
         relevance = 0.0
 
         # Prepare content
         if not case_sensitive:
-            content_lower = content.lower()
+            if content_lower is None:
+                content_lower = content.lower()
             query_lower = query.lower()
         else:
             content_lower = content
@@ -609,23 +895,54 @@ class ConversationSearcher:
             relevance += min(0.3, count * 0.1)
 
         # Token overlap
-        content_tokens = set(content_lower.split()) - self.stop_words
+        words = content_lower.split()
+        content_tokens = set(words) - self.stop_words
         if query_tokens and content_tokens:
             overlap = len(query_tokens & content_tokens)
             relevance += min(0.4, overlap / len(query_tokens) * 0.4)
 
-        # Proximity bonus - are query terms near each other?
-        if len(query_tokens) > 1:
-            # Check if all query tokens appear within a window
-            words = content_lower.split()
-            for i in range(len(words) - len(query_tokens)):
-                window = set(words[i : i + len(query_tokens) * 2])
-                if query_tokens.issubset(window):
-                    relevance += 0.1
-                    break
+        # Proximity bonus - are query terms near each other? Only possible
+        # when every term occurs somewhere in the content
+        if len(query_tokens) > 1 and query_tokens <= content_tokens:
+            if self._terms_within_window(words, query_tokens):
+                relevance += 0.1
 
         return min(1.0, relevance)
 
+    def _terms_within_window(self, words: List[str], terms: Set[str]) -> bool:
+        """
+        Check whether all terms occur within some window of 2 * len(terms) words.
+
+        Slides the window across the words once, counting the terms inside it,
+        instead of building a set for every window position.
+        """
+        width = len(terms) * 2
+        counts: Dict[str, int] = {}
+        present = 0
+        end = 0
+
+        for start in range(len(words) - len(terms)):
+            # Extend the window to [start, start + width)
+            while end < min(start + width, len(words)):
+                word = words[end]
+                if word in terms:
+                    counts[word] = counts.get(word, 0) + 1
+                    if counts[word] == 1:
+                        present += 1
+                end += 1
+
+            if present == len(terms):
+                return True
+
+            # Drop the word leaving the window
+            word = words[start]
+            if word in terms:
+                counts[word] -= 1
+                if counts[word] == 0:
+                    present -= 1
+
+        return False
+
     def _calculate_semantic_similarity(
         self, query_doc, query_tokens, content_doc
     ) -> float:
@@ -659,12 +976,19 @@ class ConversationSearcher:
         return base_similarity
 
     def _extract_context(
-        self, content: str, query: str, case_sensitive: bool, context_size: int = 150
+        self,
+        content: str,
+        query: str,
+        case_sensitive: bool,
+        context_size: int = 150,
+        content_lower: Optional[str] = None,
     ) -> str:
         """Extract context around the match for display."""
         if not case_sensitive:
             # Find match position
-            pos = content.lower().find(query.lower())
+            if content_lower is None:
+                content_lower = content.lower()
+            pos = content_lower.find(query.lower())
         else:
             pos = content.find(query)
 
@@ -689,7 +1013,7 @@ class ConversationSearcher:
         # Highlight the match
         if not case_sensitive:
             # Case-insensitive replacement
-            pattern = re.compile(re.escape(query), re.IGNORECASE)
+            pattern = _compile(re.escape(query), re.IGNORECASE)
             context = pattern.sub(f"**{query.upper()}**", context)
         else:
             context = context.replace(query, f"**{query}**")
@@ -703,7 +1027,7 @@ class ConversationSearcher:
         if search_dir is None:
             search_dir = Path.home() / ".claude" / "projects"
 
-        jsonl_files = list(search_dir.rglob("*.jsonl"))
+        jsonl_files = list(_iter_jsonl(search_dir))
         return self._filter_files_by_date(jsonl_files, date_from, date_to)
 
     def get_conversation_topics(
@@ -746,7 +1070,7 @@ class ConversationSearcher:
                 noun_phrases.append(chunk.text.lower())
 
         # Count frequency
-        phrase_counts = {}
+        phrase_counts: Dict[str, int] = {}
         for phrase in noun_phrases:
             phrase_counts[phrase] = phrase_counts.get(phrase, 0) + 1
 
@@ -763,15 +1087,18 @@ def create_search_index(search_dir: Path, output_file: Path) -> None:
 
     This pre-processes all conversations and saves metadata.
     """
-    index = {"created": datetime.now().isoformat(), "conversations": {}}
+    index: Dict[str, Any] = {
+        "created": datetime.now().isoformat(),
+        "conversations": {},
+    }
 
-    jsonl_files = list(search_dir.rglob("*.jsonl"))
+    jsonl_files = list(_iter_jsonl(search_dir))
 
     for jsonl_file in jsonl_files:
         conv_id = jsonl_file.stem
 
         # Extract metadata
-        metadata = {
+        metadata: Dict[str, Any] = {
             "path": str(jsonl_file),
             "modified": datetime.fromtimestamp(jsonl_file.stat().st_mtime).isoformat(),
             "size": jsonl_file.stat().st_size,
@@ -3,8 +3,13 @@
 Sample conversations for testing search functionality
 """
 
+import atexit
 import json
+import os
+import re
+import shutil
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 
 # Sample conversation data that covers various scenarios
@@ -119,72 +124,140 @@ SAMPLE_CONVERSATIONS = [
 ]
 
 
-class ConversationFixtures:
-    """Helper class to create test conversation files"""
+# Encoded JSONL of each sample conversation, serialized once at import
+_JSONL_BLOBS = {
+    conv["id"]: b"".join(
+        json.dumps(msg).encode("utf-8") + b"\n" for msg in conv["messages"]
+    )
+    for conv in SAMPLE_CONVERSATIONS
+}
 
-    @staticmethod
-    def create_test_environment():
-        """Create a temporary directory with sample conversations"""
-        temp_dir = tempfile.mkdtemp()
-        claude_dir = Path(temp_dir) / ".claude" / "projects"
 
-        # Create conversations in different project directories
-        projects = ["python_help", "web_dev", "data_science"]
+def _write_blob(path, blob):
+    """Write bytes to a new file with a single unbuffered write"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, blob)
+    finally:
+        os.close(fd)
+
+
+# (project directory, conversation id) of every fixture file, 1-2 per project
+_LAYOUT = [
+    (project, conv["id"])
+    for project, convs in zip(
+        ["python_help", "web_dev", "data_science"],
+        [
+            SAMPLE_CONVERSATIONS[i : i + 2]
+            for i in range(0, len(SAMPLE_CONVERSATIONS), 2)
+        ],
+    )
+    for conv in convs
+]
 
-        all_files = []
-        conversation_idx = 0
 
-        for project in projects:
-            project_dir = claude_dir / project
-            project_dir.mkdir(parents=True)
+def _fixture_files(root):
+    """Paths of the fixture files under root, in layout order"""
+    claude_dir = Path(root) / ".claude" / "projects"
+    return [
+        claude_dir / project / f"chat_{conv_id}.jsonl" for project, conv_id in _LAYOUT
+    ]
 
-            # Create 1-2 conversations per project
-            for i in range(min(2, len(SAMPLE_CONVERSATIONS) - conversation_idx)):
-                if conversation_idx >= len(SAMPLE_CONVERSATIONS):
-                    break
 
-                conv_data = SAMPLE_CONVERSATIONS[conversation_idx]
-                chat_file = project_dir / f"chat_{conv_data['id']}.jsonl"
+def _write_tree(root):
+    """Write every sample conversation under root"""
+    for (_, conv_id), chat_file in zip(_LAYOUT, _fixture_files(root)):
+        chat_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write messages as JSONL in one call
+        _write_blob(chat_file, _JSONL_BLOBS[conv_id])
 
-                # Write messages as JSONL
-                with open(chat_file, "w") as f:
-                    for msg in conv_data["messages"]:
-                        f.write(json.dumps(msg) + "\n")
 
-                all_files.append(chat_file)
-                conversation_idx += 1
+@lru_cache(maxsize=None)
+def _build_test_environment():
+    """Write the sample conversation tree once per test process"""
+    temp_dir = tempfile.mkdtemp()
+    atexit.register(shutil.rmtree, temp_dir, True)
+    _write_tree(temp_dir)
+    return temp_dir, tuple(_fixture_files(temp_dir))
 
-        return temp_dir, all_files
+
+# Queries whose ground truth is computed from SAMPLE_CONVERSATIONS below
+TEXT_QUERIES = [
+    # Exact matches
+    "Python errors",
+    "PostgreSQL database",
+    # Partial matches
+    "python",
+    "error",
+    "file",
+    "regex",
+    "API",
+    # Case insensitive
+    "PYTHON",
+    # Multi-word
+    "handle errors",
+    "read write files",
+    # Code snippets
+    "try except",
+    "requests.get",
+    "open file",
+    # No matches
+    "javascript",
+    "rust programming",
+]
+REGEX_QUERIES = [
+    r"except \w+Error",
+    r"@[a-zA-Z0-9.-]+",
+]
+
+
+def _conversations_matching(matches):
+    """Ids of the sample conversations with a message satisfying matches"""
+    return [
+        conv["id"]
+        for conv in SAMPLE_CONVERSATIONS
+        if any(matches(msg["content"]) for msg in conv["messages"])
+    ]
+
+
+# Reference results, computed once at import so they can't drift from the data
+_EXPECTED_RESULTS = {
+    **{
+        query: _conversations_matching(lambda text, q=query.lower(): q in text.lower())
+        for query in TEXT_QUERIES
+    },
+    **{
+        pattern: _conversations_matching(
+            lambda text, r=re.compile(pattern, re.IGNORECASE): r.search(text)
+        )
+        for pattern in REGEX_QUERIES
+    },
+}
+
+
+class ConversationFixtures:
+    """Helper class to create test conversation files"""
+
+    @staticmethod
+    def create_test_environment():
+        """
+        Return a directory with sample conversations.
+
+        The tree is built on first call and shared by every later caller in
+        the process, so tests must not rely on changes made by other tests.
+        """
+        temp_dir, all_files = _build_test_environment()
+        return temp_dir, list(all_files)
 
     @staticmethod
     def get_expected_search_results():
-        """Get expected search results for various queries"""
-        return {
-            # Exact matches
-            "Python errors": ["python_errors"],
-            "PostgreSQL database": ["database_connection"],
-            # Partial matches
-            "python": ["python_errors", "file_operations", "api_requests"],
-            "error": ["python_errors"],
-            "file": ["file_operations"],
-            "regex": ["regex_patterns"],
-            "API": ["api_requests"],
-            # Case insensitive
-            "PYTHON": ["python_errors", "file_operations", "api_requests"],
-            # Multi-word
-            "handle errors": ["python_errors"],
-            "read write files": ["file_operations"],
-            # Code snippets
-            "try except": ["python_errors"],
-            "requests.get": ["api_requests"],
-            "open file": ["file_operations"],
-            # Regex patterns
-            r"except \w+Error": ["python_errors"],
-            r"@[a-zA-Z0-9.-]+": ["regex_patterns"],
-            # No matches
-            "javascript": [],
-            "rust programming": [],
-        }
+        """
+        Get expected search results for various queries.
+
+        Maps each query to the conversations with a message containing it
+        (ignoring case), or matching it for regex patterns.
+        """
+        return {query: list(ids) for query, ids in _EXPECTED_RESULTS.items()}
 
     @staticmethod
     def get_date_filtered_results():
@@ -213,6 +286,10 @@ class ConversationFixtures:
 
 def cleanup_test_environment(temp_dir):
     """Clean up the test environment"""
-    import shutil
-
+    # The shared tree outlives individual tests and is removed at exit
+    if (
+        _build_test_environment.cache_info().currsize
+        and temp_dir == _build_test_environment()[0]
+    ):
+        return
     shutil.rmtree(temp_dir, ignore_errors=True)
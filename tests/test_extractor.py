@@ -123,6 +123,20 @@ class TestClaudeConversationExtractor(unittest.TestCase):
         self.assertEqual(conversation[1]["role"], "assistant")
         self.assertEqual(conversation[1]["content"], "Test response")
 
+    def test_iter_messages_skips_malformed_lines(self):
+        """Test streaming entries skips blank and invalid JSONL lines"""
+        jsonl_file = Path(self.temp_dir) / "stream.jsonl"
+        jsonl_file.write_text(
+            json.dumps({"type": "user", "content": "one"})
+            + "\n\nnot json\n[1, 2]\n"
+            + json.dumps({"type": "assistant", "content": "two"})
+            + "\n"
+        )
+
+        entries = list(self.extractor.iter_messages(jsonl_file))
+
+        self.assertEqual([e["content"] for e in entries], ["one", "two"])
+
     def test_extract_conversation_invalid_file(self):
         """Test extracting conversation from non-existent file"""
         fake_path = Path(self.temp_dir) / "non_existent.jsonl"
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Tests for the trigram search index
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Add parent directory to path before local imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+# Local imports after sys.path modification
+from index_builder import (SAVE_INTERVAL, TrigramIndex,  # noqa: E402
+                           prune_indexes, trigrams)
+from search_conversations import ConversationSearcher  # noqa: E402
+
+
+class TestTrigramIndex(unittest.TestCase):
+    """Test TrigramIndex building, querying and persistence"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.search_dir = self.temp_dir / "projects"
+        self.cache_dir = self.temp_dir / "cache"
+        self.search_dir.mkdir()
+        self.cache_dir.mkdir()
+
+        self.texts = {
+            "python.jsonl": ["How do I fix this Python error?"],
+            "sql.jsonl": ["Tune the PostgreSQL query planner"],
+        }
+        self.files = []
+        for name in self.texts:
+            path = self.search_dir / name
+            path.write_text("")
+            self.files.append(path)
+
+    def tearDown(self):
+        """Clean up test files"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _read_texts(self, path):
+        return self.texts[path.name]
+
+    def test_trigrams(self):
+        """Test trigram extraction"""
+        self.assertEqual(trigrams("abcd"), {"abc", "bcd"})
+        self.assertEqual(trigrams("ab"), set())
+
+    def test_files_containing(self):
+        """Test only files with every trigram of a term are candidates"""
+        index = TrigramIndex(self.search_dir, self.cache_dir)
+        index.update(self.files, self._read_texts)
+
+        self.assertEqual(index.files_containing("PYTHON"), {str(self.files[0])})
+        self.assertEqual(index.files_containing("postgresql"), {str(self.files[1])})
+        self.assertEqual(index.files_containing("javascript"), set())
+        self.assertIsNone(index.files_containing("py"))
+
+    def test_unchanged_files_not_reread(self):
+        """Test a saved index is reused for files that haven't changed"""
+        TrigramIndex(self.search_dir, self.cache_dir).update(
+            self.files, self._read_texts
+        )
+
+        read_texts = Mock(side_effect=self._read_texts)
+        index = TrigramIndex(self.search_dir, self.cache_dir)
+        index.update(self.files, read_texts)
+
+        read_texts.assert_not_called()
+        self.assertEqual(index.files_containing("python"), {str(self.files[0])})
+
+    def test_changed_file_reindexed(self):
+        """Test a modified file is re-read and a deleted one dropped"""
+        index = TrigramIndex(self.search_dir, self.cache_dir)
+        index.update(self.files, self._read_texts)
+
+        self.texts["python.jsonl"] = ["Now about JavaScript instead"]
+        self.files[0].write_text("changed")
+        os.utime(self.files[0], ns=(0, 10**9))
+        index.update(self.files[:1], self._read_texts)
+
+        self.assertEqual(index.files_containing("javascript"), {str(self.files[0])})
+        self.assertEqual(index.files_containing("python"), set())
+        self.assertFalse(index.is_indexed(self.files[1]))
+
+    def test_partial_update_keeps_other_files(self):
+        """Test updating a subset without pruning keeps the other entries"""
+        index = TrigramIndex(self.search_dir, self.cache_dir)
+        index.update(self.files, self._read_texts)
+        index.update(self.files[:1], self._read_texts, prune=False)
+
+        self.assertTrue(index.is_indexed(self.files[1]))
+        self.assertEqual(index.files_containing("postgresql"), {str(self.files[1])})
+
+    def test_postings_updated_in_place(self):
+        """Test a changed file updates the postings without a full rebuild"""
+        index = TrigramIndex(self.search_dir, self.cache_dir)
+        index.update(self.files, self._read_texts)
+        self.assertEqual(index.files_containing("python"), {str(self.files[0])})
+        postings = index._postings
+
+        self.texts["python.jsonl"] = ["Now about JavaScript instead"]
+        self.files[0].write_text("changed")
+        index.update(self.files, self._read_texts)
+
+        self.assertIs(index._postings, postings)
+        self.assertEqual(index.files_containing("javascript"), {str(self.files[0])})
+        self.assertEqual(index.files_containing("python"), set())
+        self.assertEqual(index.files_containing("postgresql"), {str(self.files[1])})
+
+    def test_saved_index_round_trips(self):
+        """Test a saved index reloads with compact doc ids and the same matches"""
+        index = TrigramIndex(self.search_dir, self.cache_dir)
+        index.update(self.files, self._read_texts)
+        self.texts["python.jsonl"] = ["Now about JavaScript instead"]
+        self.files[0].write_text("changed")
+        index.update(self.files, self._read_texts)
+        index.save()
+
+        loaded = TrigramIndex(self.search_dir, self.cache_dir)
+
+        self.assertEqual(sorted(e[2] for e in loaded._files.values()), [0, 1])
+        self.assertEqual(loaded.files_containing("javascript"), {str(self.files[0])})
+        self.assertEqual(loaded.files_containing("python"), set())
+        self.assertEqual(loaded.files_containing("postgresql"), {str(self.files[1])})
+
+    def test_corrupt_index_ignored(self):
+        """Test an unreadable or tampered index file starts an empty index"""
+        index = TrigramIndex(self.search_dir, self.cache_dir)
+        index.update(self.files, self._read_texts)
+        data = index.index_file.read_bytes()
+
+        for corrupt in (b"junk", data[:-1], data + b"\xff"):
+            with self.subTest(corrupt=corrupt[-8:]):
+                index.index_file.write_bytes(corrupt)
+                loaded = TrigramIndex(self.search_dir, self.cache_dir)
+                self.assertFalse(loaded.is_indexed(self.files[0]))
+
+    def test_saves_are_rate_limited(self):
+        """Test repeated changes rewrite the index at most once per interval"""
+        index = TrigramIndex(self.search_dir, self.cache_dir)
+        index.update(self.files, self._read_texts)
+        self.assertTrue(index.index_file.exists())
+
+        with patch.object(index, "save") as mock_save:
+            self.files[0].write_text("changed")
+            index.update(self.files, self._read_texts)
+            mock_save.assert_not_called()
+
+            with patch(
+                "index_builder.time.monotonic",
+                return_value=index._last_save + SAVE_INTERVAL,
+            ):
+                self.files[0].write_text("changed again")
+                index.update(self.files, self._read_texts)
+            mock_save.assert_called_once()
+
+    def test_prune_removes_indexes_of_missing_dirs(self):
+        """Test pruning deletes indexes whose search directory is gone"""
+        TrigramIndex(self.search_dir, self.cache_dir).update(
+            self.files, self._read_texts
+        )
+        gone_dir = self.temp_dir / "gone"
+        gone_dir.mkdir()
+        TrigramIndex(gone_dir, self.cache_dir).save()
+        gone_dir.rmdir()
+        self.assertEqual(len(list(self.cache_dir.glob("trigrams-*.idx"))), 2)
+        (self.cache_dir / "trigrams-0000000000000000.idx").write_bytes(b"junk")
+        # Indexes from the old pickle format are deleted without being loaded
+        (self.cache_dir / "trigrams-1111111111111111.pickle").write_bytes(b"junk")
+
+        prune_indexes(self.cache_dir)
+
+        remaining = list(self.cache_dir.glob("trigrams-*"))
+        self.assertEqual(
+            remaining, [TrigramIndex(self.search_dir, self.cache_dir).index_file]
+        )
+
+
+class TestSearcherIndex(unittest.TestCase):
+    """Test ConversationSearcher only scans index candidates"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.search_dir = self.temp_dir / "projects"
+        self.search_dir.mkdir()
+
+        for name, content in [
+            ("python.jsonl", "How do I fix this Python error?"),
+            ("sql.jsonl", "Tune the PostgreSQL query planner"),
+        ]:
+            with open(self.search_dir / name, "w") as f:
+                f.write(json.dumps({"type": "user", "content": content}) + "\n")
+
+        self.searcher = ConversationSearcher(cache_dir=self.temp_dir / "cache")
+
+    def tearDown(self):
+        """Clean up test files"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_exact_search_scans_candidates_only(self):
+        """Test exact search skips files missing the query's trigrams"""
+        with patch.object(
+            self.searcher, "_search_exact", wraps=self.searcher._search_exact
+        ) as mock_exact:
+            results = self.searcher.search(
+                "postgresql", search_dir=self.search_dir, mode="exact"
+            )
+
+        self.assertEqual(len(results), 1)
+        scanned = [c[0][0].name for c in mock_exact.call_args_list]
+        self.assertEqual(scanned, ["sql.jsonl"])
+
+    def test_smart_search_matches_any_word(self):
+        """Test smart search keeps files containing any query word"""
+        with patch.object(
+            self.searcher, "_search_smart", wraps=self.searcher._search_smart
+        ) as mock_smart:
+            self.searcher.search(
+                "python planner", search_dir=self.search_dir, mode="smart"
+            )
+
+        scanned = sorted(c[0][0].name for c in mock_smart.call_args_list)
+        self.assertEqual(scanned, ["python.jsonl", "sql.jsonl"])
+
+    def test_date_filter_applied_before_indexing(self):
+        """Test files outside the date range are neither indexed nor read"""
+        os.utime(self.search_dir / "python.jsonl", (0, 0))
+
+        with patch.object(
+            self.searcher,
+            "_iter_message_texts",
+            wraps=self.searcher._iter_message_texts,
+        ) as mock_texts:
+            results = self.searcher.search(
+                "python postgresql",
+                search_dir=self.search_dir,
+                date_from=datetime(2000, 1, 1),
+            )
+
+        self.assertEqual(len(results), 1)
+        read = [c[0][0].name for c in mock_texts.call_args_list]
+        self.assertEqual(read, ["sql.jsonl"])
+
+    def test_regex_search_not_narrowed(self):
+        """Test regex search still scans every file"""
+        results = self.searcher.search(
+            r"Postgre\w+", search_dir=self.search_dir, mode="regex"
+        )
+
+        self.assertEqual(len(results), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
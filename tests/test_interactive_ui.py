@@ -4,9 +4,12 @@ Test suite for interactive UI components
 """
 
 import json
+import os
+import subprocess
 import sys
 import tempfile
 import unittest
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -116,7 +119,7 @@ class TestInteractiveUI(unittest.TestCase):
         ]
         self.assertTrue(len(error_calls) > 0)
 
-    @patch("interactive_ui.subprocess.run")
+    @patch("interactive_ui.subprocess.Popen")
     @patch("interactive_ui.platform.system")
     def test_open_folder_macos(self, mock_platform, mock_subprocess):
         """Test opening folder on macOS"""
@@ -125,7 +128,12 @@ class TestInteractiveUI(unittest.TestCase):
         test_path = Path("/test/output")
         self.ui.open_folder(test_path)
 
-        mock_subprocess.assert_called_once_with(["open", str(test_path)])
+        mock_subprocess.assert_called_once_with(
+            ["open", str(test_path)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
 
     @patch("interactive_ui.platform.system")
     def test_open_folder_windows(self, mock_platform):
@@ -138,7 +146,7 @@ class TestInteractiveUI(unittest.TestCase):
             self.ui.open_folder(test_path)
             mock_startfile.assert_called_once_with(str(test_path))
 
-    @patch("interactive_ui.subprocess.run")
+    @patch("interactive_ui.subprocess.Popen")
     @patch("interactive_ui.platform.system")
     def test_open_folder_linux(self, mock_platform, mock_subprocess):
         """Test opening folder on Linux"""
@@ -147,7 +155,12 @@ class TestInteractiveUI(unittest.TestCase):
         test_path = Path("/test/output")
         self.ui.open_folder(test_path)
 
-        mock_subprocess.assert_called_once_with(["xdg-open", str(test_path)])
+        mock_subprocess.assert_called_once_with(
+            ["xdg-open", str(test_path)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
 
     def test_print_centered(self):
         """Test centered text printing"""
@@ -172,6 +185,54 @@ class TestInteractiveUI(unittest.TestCase):
         self.assertIn("5/10", printed)
         self.assertIn("Processing", printed)
 
+    @patch("builtins.print")
+    @patch("interactive_ui.KeyboardHandler")
+    @patch("interactive_ui.sys.stdin")
+    def test_read_choice_single_keypress(self, mock_stdin, mock_handler, mock_print):
+        """Test menu choices dispatch on a single keypress in a terminal"""
+        mock_stdin.isatty.return_value = True
+        keyboard = mock_handler.return_value.__enter__.return_value
+        keyboard.get_key.side_effect = [None, "ENTER", "a"]
+
+        self.assertEqual(self.ui.read_choice("Your choice: "), "A")
+        self.assertEqual(keyboard.get_key.call_count, 3)
+
+    @patch("builtins.print")
+    @patch("builtins.input")
+    @patch("interactive_ui.KeyboardHandler")
+    @patch("interactive_ui.sys.stdin")
+    def test_read_choice_keeps_typeahead(
+        self, mock_stdin, mock_handler, mock_input, mock_print
+    ):
+        """Test keys read along with a menu choice feed the next prompt"""
+        mock_stdin.isatty.return_value = True
+        keyboard = mock_handler.return_value.__enter__.return_value
+        keyboard.get_key.return_value = "s"
+        keyboard.take_pending.return_value = b"1,3\r"
+
+        self.assertEqual(self.ui.read_choice("Your choice: "), "S")
+        keyboard.push_back.assert_called_once_with(b"")
+
+        self.assertEqual(self.ui.read_line("Numbers: "), "1,3")
+        mock_input.assert_not_called()
+
+    @patch("builtins.input", return_value="5")
+    def test_read_line_completes_partial_typeahead(self, mock_input):
+        """Test a partly typed-ahead line is finished with input()"""
+        self.ui._typeahead = b"1,"
+
+        self.assertEqual(self.ui.read_line("Numbers: "), "1,5")
+        mock_input.assert_called_once_with("Numbers: 1,")
+
+    @patch("builtins.input", return_value=" r ")
+    @patch("interactive_ui.sys.stdin")
+    def test_read_choice_falls_back_to_input(self, mock_stdin, mock_input):
+        """Test line input is used when stdin is not a terminal"""
+        mock_stdin.isatty.return_value = False
+
+        self.assertEqual(self.ui.read_choice("Your choice: "), "R")
+        mock_input.assert_called_once_with("Your choice: ")
+
     @patch("builtins.input")
     def test_show_sessions_menu_all(self, mock_input):
         """Test selecting all conversations"""
@@ -268,6 +329,23 @@ class TestInteractiveUIIntegration(unittest.TestCase):
 
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
+    @patch("builtins.input", return_value="Q")
+    @patch("builtins.print")
+    def test_sessions_menu_row_format(self, mock_print, mock_input):
+        """Test session rows show the local modification time and size"""
+        ui = InteractiveUI()
+        ui.extractor.claude_dir = self.claude_dir
+        session = self.claude_dir / "project_0" / "chat_0.jsonl"
+        os.utime(session, (1700000000, 1700000000))
+
+        ui.show_sessions_menu()
+
+        expected_date = datetime.fromtimestamp(1700000000).strftime("%Y-%m-%d %H:%M")
+        rows = [str(c) for c in mock_print.call_args_list if "project_0" in str(c)]
+        self.assertEqual(len(rows), 1)
+        self.assertIn(f"[{expected_date}]", rows[0])
+        self.assertIn("KB)", rows[0])
+
     @patch("extract_claude_logs.Path.home")
     @patch("builtins.input")
     @patch("builtins.print")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for the optional mypyc build of the search modules
+"""
+
+import importlib.util
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+import zipfile
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# Runs against the unpacked wheel only, in a fresh interpreter
+SMOKE_SCRIPT = textwrap.dedent(
+    """
+    import json, sys, tempfile
+    from pathlib import Path
+
+    import index_builder, search_conversations
+    from realtime_search import create_smart_searcher
+
+    for module in (index_builder, search_conversations):
+        assert not module.__file__.endswith(".py"), module.__file__
+
+    root = Path(tempfile.mkdtemp())
+    project = root / "projects" / "demo"
+    project.mkdir(parents=True)
+    message = {"type": "user", "message": {"role": "user",
+               "content": "How do I handle Python errors?"}}
+    (project / "chat.jsonl").write_text(json.dumps(message) + "\\n")
+
+    searcher = search_conversations.ConversationSearcher(cache_dir=root / "cache")
+    smart_searcher = create_smart_searcher(searcher)
+    results = smart_searcher.search("python", search_dir=root / "projects")
+    assert len(results) == 1, results
+    print("ok")
+    """
+)
+
+
+@unittest.skipUnless(
+    importlib.util.find_spec("mypyc") and importlib.util.find_spec("wheel"),
+    "mypyc build dependencies not installed",
+)
+class TestMypycBuild(unittest.TestCase):
+    """Build the compiled wheel and search with the installed modules"""
+
+    def setUp(self):
+        """Copy the project so the build leaves the checkout untouched"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.project_dir = self.temp_dir / "project"
+        self.project_dir.mkdir()
+        for name in ("setup.py", "pyproject.toml", "README.md"):
+            shutil.copy(ROOT / name, self.project_dir)
+        shutil.copytree(
+            ROOT / "src",
+            self.project_dir / "src",
+            ignore=shutil.ignore_patterns("__pycache__"),
+        )
+
+    def tearDown(self):
+        """Clean up the build tree"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_smart_search_with_compiled_modules(self):
+        """Test create_smart_searcher(...).search() on the compiled searcher"""
+        wheel_dir = self.temp_dir / "wheels"
+        subprocess.run(
+            [
+                sys.executable, "-m", "pip", "wheel", "--no-build-isolation",
+                "--no-deps", "-q", "-w", str(wheel_dir), str(self.project_dir),
+            ],
+            check=True,
+            env={**os.environ, "CCX_MYPYC": "1"},
+        )
+
+        install_dir = self.temp_dir / "site"
+        (wheel,) = wheel_dir.glob("*.whl")
+        with zipfile.ZipFile(wheel) as zf:
+            zf.extractall(install_dir)
+
+        result = subprocess.run(
+            [sys.executable, "-c", SMOKE_SCRIPT],
+            capture_output=True,
+            text=True,
+            cwd=self.temp_dir,
+            env={**os.environ, "PYTHONPATH": str(install_dir)},
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.splitlines()[-1], "ok")
+
+
+if __name__ == "__main__":
+    unittest.main()
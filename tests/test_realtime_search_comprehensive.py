@@ -3,6 +3,7 @@
 Comprehensive tests for realtime_search.py to achieve 100% coverage
 """
 
+import io
 import sys
 import threading
 import time
@@ -40,7 +41,7 @@ class TestSearchStateComprehensive(unittest.TestCase):
             cursor_pos=4,
             results=results,
             selected_index=1,
-            last_update=time.time(),
+            last_update=time.monotonic(),
             is_searching=True,
         )
         self.assertEqual(state.query, "test")
@@ -56,53 +57,135 @@ class TestKeyboardHandlerComprehensive(unittest.TestCase):
     @patch("sys.platform", "darwin")
     def test_unix_keyboard_special_keys(self):
         """Test Unix keyboard handler with all special keys"""
-        with patch("realtime_search.termios"), patch("realtime_search.tty"), patch(
-            "realtime_search.select"
-        ) as mock_select, patch("sys.stdin") as mock_stdin:
+        with patch("sys.stdin.fileno", return_value=0), patch(
+            "realtime_search.selectors"
+        ) as mock_selectors, patch("realtime_search.os.read") as mock_read:
 
             handler = KeyboardHandler()
+            mock_selectors.DefaultSelector.return_value.select.return_value = [True]
 
             # Test arrow keys
             test_cases = [
-                ([True], ["\x1b", "[", "A"], "UP"),
-                ([True], ["\x1b", "[", "B"], "DOWN"),
-                ([True], ["\x1b", "[", "C"], "RIGHT"),
-                ([True], ["\x1b", "[", "D"], "LEFT"),
-                ([True], ["\x1b"], "ESC"),  # ESC alone
-                ([True], ["\r"], "ENTER"),
-                ([True], ["\n"], "ENTER"),
-                ([True], ["\x7f"], "BACKSPACE"),
-                ([True], ["\x08"], "BACKSPACE"),
-                ([True], ["a"], "a"),  # Regular character
+                (b"\x1b[A", "UP"),
+                (b"\x1b[B", "DOWN"),
+                (b"\x1b[C", "RIGHT"),
+                (b"\x1b[D", "LEFT"),
+                (b"\x1b", "ESC"),  # ESC alone
+                (b"\r", "ENTER"),
+                (b"\n", "ENTER"),
+                (b"\x7f", "BACKSPACE"),
+                (b"\x08", "BACKSPACE"),
+                (b"a", "a"),  # Regular character
+                (b"\x1b[5~", None),  # Unknown sequence is consumed
             ]
 
-            for select_return, stdin_chars, expected in test_cases:
-                mock_select.select.side_effect = [
-                    (
-                        select_return if i == 0 else [stdin_chars[i] is not None]
-                        for i in range(len(stdin_chars))
-                    )
-                ]
-                mock_stdin.read.side_effect = stdin_chars
+            for data, expected in test_cases:
+                mock_read.return_value = data
 
                 key = handler.get_key(timeout=0.1)
                 self.assertEqual(key, expected)
+                self.assertEqual(handler._pending, b"")
+
+    @patch("sys.platform", "darwin")
+    def test_unix_keyboard_typeahead_single_read(self):
+        """Test keys read together are returned without another read"""
+        with patch("sys.stdin.fileno", return_value=0), patch(
+            "realtime_search.selectors"
+        ) as mock_selectors, patch("realtime_search.os.read") as mock_read:
+
+            handler = KeyboardHandler()
+            selector = mock_selectors.DefaultSelector.return_value
+            selector.select.return_value = [True]
+            mock_read.return_value = b"ab\x1b[Ac"
 
-                # Reset mocks
-                mock_select.select.reset_mock()
-                mock_stdin.read.reset_mock()
+            keys = [handler.get_key(timeout=0.1) for _ in range(4)]
+
+            self.assertEqual(keys, ["a", "b", "UP", "c"])
+            mock_read.assert_called_once_with(0, 32)
+            selector.select.assert_called_once_with(0.1)
+
+    @patch("sys.platform", "darwin")
+    def test_unix_keyboard_sequence_split_across_reads(self):
+        """Test an escape sequence cut off by a full read is completed"""
+        with patch("sys.stdin.fileno", return_value=0), patch(
+            "realtime_search.selectors"
+        ) as mock_selectors, patch("realtime_search.os.read") as mock_read:
+
+            handler = KeyboardHandler()
+            mock_selectors.DefaultSelector.return_value.select.return_value = [True]
+            # 11 queued DOWN keys; the first read stops inside the last one
+            mock_read.side_effect = [b"\x1b[B" * 10 + b"\x1b[", b"B"]
+
+            keys = [handler.get_key(timeout=0.1) for _ in range(11)]
+
+            self.assertEqual(keys, ["DOWN"] * 11)
+            self.assertEqual(handler._pending, b"")
+
+    @patch("sys.platform", "darwin")
+    def test_unix_keyboard_esc_split_across_reads(self):
+        """Test an ESC ending a full read waits for the rest of its sequence"""
+        with patch("sys.stdin.fileno", return_value=0), patch(
+            "realtime_search.selectors"
+        ) as mock_selectors, patch("realtime_search.os.read") as mock_read:
+
+            handler = KeyboardHandler()
+            mock_selectors.DefaultSelector.return_value.select.return_value = [True]
+            mock_read.side_effect = [b"a" * 31 + b"\x1b", b"[A"]
+
+            keys = [handler.get_key(timeout=0.1) for _ in range(32)]
+
+            self.assertEqual(keys, ["a"] * 31 + ["UP"])
+
+    @patch("sys.platform", "darwin")
+    def test_unix_keyboard_function_keys(self):
+        """Test F-keys are consumed whole and SS3 arrows are recognized"""
+        with patch("sys.stdin.fileno", return_value=0), patch(
+            "realtime_search.selectors"
+        ) as mock_selectors, patch("realtime_search.os.read") as mock_read:
+
+            handler = KeyboardHandler()
+            mock_selectors.DefaultSelector.return_value.select.return_value = [True]
+            # F1, F5, then an application-mode UP arrow and a typed key
+            mock_read.return_value = b"\x1bOP\x1b[15~\x1bOAx"
+
+            keys = [handler.get_key(timeout=0.1) for _ in range(4)]
+
+            self.assertEqual(keys, [None, None, "UP", "x"])
+            mock_read.assert_called_once()
+
+    @patch("sys.platform", "darwin")
+    def test_unix_keyboard_push_back_and_take_pending(self):
+        """Test typeahead can be handed from one handler to the next"""
+        with patch("sys.stdin.fileno", return_value=0), patch(
+            "realtime_search.selectors"
+        ) as mock_selectors, patch("realtime_search.os.read") as mock_read:
+
+            first = KeyboardHandler()
+            mock_selectors.DefaultSelector.return_value.select.return_value = [True]
+            mock_read.return_value = b"s1,"
+
+            self.assertEqual(first.get_key(timeout=0.1), "s")
+            leftover = first.take_pending()
+            self.assertEqual(leftover, b"1,")
+
+            second = KeyboardHandler()
+            second.push_back(leftover)
+            keys = [second.get_key(timeout=0.1) for _ in range(2)]
+
+            self.assertEqual(keys, ["1", ","])
+            mock_read.assert_called_once()
 
     @patch("sys.platform", "darwin")
     def test_unix_keyboard_ctrl_c(self):
         """Test Unix keyboard handler Ctrl+C"""
-        with patch("realtime_search.termios"), patch("realtime_search.tty"), patch(
-            "realtime_search.select"
-        ) as mock_select, patch("sys.stdin") as mock_stdin:
+        with patch("sys.stdin.fileno", return_value=0), patch(
+            "realtime_search.selectors"
+        ) as mock_selectors, patch("realtime_search.os.read") as mock_read:
 
             handler = KeyboardHandler()
 
-            mock_select.select.return_value = ([True], [], [])
-            mock_stdin.read.return_value = "\x03"  # Ctrl+C
+            mock_selectors.DefaultSelector.return_value.select.return_value = [True]
+            mock_read.return_value = b"\x03"  # Ctrl+C
 
             with self.assertRaises(KeyboardInterrupt):
                 handler.get_key(timeout=0.1)
@@ -110,17 +193,18 @@ class TestKeyboardHandlerComprehensive(unittest.TestCase):
     @patch("sys.platform", "darwin")
     def test_unix_keyboard_timeout(self):
         """Test Unix keyboard timeout"""
-        with patch("realtime_search.termios"), patch("realtime_search.tty"), patch(
-            "realtime_search.select"
-        ) as mock_select:
+        with patch("sys.stdin.fileno", return_value=0), patch(
+            "realtime_search.selectors"
+        ) as mock_selectors, patch("realtime_search.os.read") as mock_read:
 
             handler = KeyboardHandler()
 
             # No input available
-            mock_select.select.return_value = ([], [], [])
+            mock_selectors.DefaultSelector.return_value.select.return_value = []
 
             key = handler.get_key(timeout=0.1)
             self.assertIsNone(key)
+            mock_read.assert_not_called()
 
     @patch("sys.platform", "win32")
     def test_windows_keyboard_all_keys(self):
@@ -187,38 +271,60 @@ class TestTerminalDisplayComprehensive(unittest.TestCase):
     def test_clear_screen_unix(self, mock_stdout):
         """Test clear screen on Unix"""
         self.display.clear_screen()
-        # Should print ANSI escape sequence
-        mock_stdout.write.assert_called()
-        written = "".join(call[0][0] for call in mock_stdout.write.call_args_list)
-        self.assertIn("\033[2J\033[H", written)
+        # Should write ANSI escape sequence
+        mock_stdout.buffer.write.assert_called()
+        self.assertIn("\033[2J\033[H", self._get_stdout_content(mock_stdout))
 
     @patch("sys.stdout")
     def test_terminal_control_methods(self, mock_stdout):
         """Test all terminal control methods"""
         # Test move cursor
         self.display.move_cursor(10, 20)
+        self.display.flush()
         self.assertIn("\033[10;20H", self._get_stdout_content(mock_stdout))
 
         # Test clear line
         mock_stdout.reset_mock()
         self.display.clear_line()
+        self.display.flush()
         self.assertIn("\033[2K", self._get_stdout_content(mock_stdout))
 
         # Test save cursor
         mock_stdout.reset_mock()
         self.display.save_cursor()
+        self.display.flush()
         self.assertIn("\033[s", self._get_stdout_content(mock_stdout))
 
         # Test restore cursor
         mock_stdout.reset_mock()
         self.display.restore_cursor()
+        self.display.flush()
         self.assertIn("\033[u", self._get_stdout_content(mock_stdout))
 
+    def test_frame_is_buffered_until_flush(self):
+        """Test drawing primitives are batched into a single write"""
+        with patch("sys.stdout") as mock_stdout:
+            self.display.move_cursor(1, 1)
+            self.display.clear_line()
+            self.display.draw_header()
+            mock_stdout.buffer.write.assert_not_called()
+
+            self.display.draw_search_box("query", 5)
+            mock_stdout.buffer.write.assert_called_once()
+
+    def test_flush_to_text_only_stdout(self):
+        """Test frames are still written when stdout has no binary buffer"""
+        with patch("sys.stdout", new_callable=io.StringIO) as fake_stdout:
+            self.display.write("🔍 frame")
+            self.display.flush()
+
+        self.assertEqual(fake_stdout.getvalue(), "🔍 frame")
+
     def _get_stdout_content(self, mock_stdout):
         """Helper to get stdout content from mock"""
-        return "".join(
-            call[0][0] for call in mock_stdout.write.call_args_list if call[0][0]
-        )
+        return b"".join(
+            call[0][0] for call in mock_stdout.buffer.write.call_args_list
+        ).decode("utf-8")
 
     @patch("sys.stdout")
     def test_draw_results_with_selection(self, mock_stdout):
@@ -239,6 +345,7 @@ class TestTerminalDisplayComprehensive(unittest.TestCase):
         ]
 
         self.display.draw_results(results, 1, "test")
+        self.display.flush()
         output = self._get_stdout_content(mock_stdout)
 
         # Second result should have selection indicator
@@ -322,7 +429,7 @@ class TestRealTimeSearchComprehensive(unittest.TestCase):
         # Set up state
         self.rts.state.query = "cached query"
         self.rts.state.is_searching = True
-        self.rts.state.last_update = time.time() - 1  # Old enough
+        self.rts.state.last_update = time.monotonic() - 1  # Old enough
 
         # Process one search request
         processed = self.rts._process_search_request()
@@ -340,7 +447,7 @@ class TestRealTimeSearchComprehensive(unittest.TestCase):
 
         self.rts.state.query = "error query"
         self.rts.state.is_searching = True
-        self.rts.state.last_update = time.time() - 1
+        self.rts.state.last_update = time.monotonic() - 1
 
         # Should not crash
         processed = self.rts._process_search_request()
@@ -405,22 +512,18 @@ class TestRealTimeSearchComprehensive(unittest.TestCase):
         # Should not change query
         self.assertEqual(self.rts.state.query, "test")
 
-    def test_trigger_search_cache_cleanup(self):
-        """Test cache cleanup on search trigger"""
-        # Populate cache with various entries
-        self.rts.results_cache = {
-            "test": [Mock()],
-            "testing": [Mock()],
-            "other": [Mock()],
-            "te": [Mock()],
-        }
+    def test_trigger_search_keeps_cache(self):
+        """Test triggering a search doesn't scan or prune the cache"""
+        for key in ("test", "testing", "other", "te"):
+            self.rts.results_cache[key] = [Mock()]
 
         self.rts.state.query = "tes"
         self.rts.trigger_search()
 
-        # Should keep entries that start with "tes"
-        self.assertNotIn("other", self.rts.results_cache)
-        self.assertNotIn("te", self.rts.results_cache)
+        # Entries age out through the LRU bound instead
+        self.assertEqual(
+            list(self.rts.results_cache), ["test", "testing", "other", "te"]
+        )
 
     @patch("realtime_search.KeyboardHandler")
     @patch("realtime_search.TerminalDisplay")
@@ -549,6 +652,50 @@ class TestCreateSmartSearcherComprehensive(unittest.TestCase):
         # Should limit to 5 results
         self.assertEqual(len(results), 5)
 
+    def test_smart_search_returns_newest_first(self):
+        """Test merged results are limited to the newest max_results"""
+        mock_searcher = Mock()
+        mock_searcher.nlp = None
+
+        def search_side_effect(query, mode=None, **kwargs):
+            if mode == "exact":
+                return [
+                    Mock(file_path=Path(f"/exact/{day}"), timestamp=datetime(2024, 1, day))
+                    for day in (3, 9, 1)
+                ]
+            return [
+                Mock(file_path=Path(f"/smart/{day}"), timestamp=datetime(2024, 1, day))
+                for day in (7, 5)
+            ]
+
+        mock_searcher.search = Mock(side_effect=search_side_effect)
+
+        smart_searcher = create_smart_searcher(mock_searcher)
+        results = smart_searcher.search("test", max_results=3)
+
+        self.assertEqual([r.timestamp.day for r in results], [9, 7, 5])
+
+    def test_smart_search_skips_semantic_when_full(self):
+        """Test semantic search is skipped once cheaper modes fill the results"""
+        mock_searcher = Mock()
+        mock_searcher.nlp = Mock()  # Has NLP
+
+        def search_side_effect(query, mode=None, **kwargs):
+            return [
+                Mock(file_path=Path(f"/{mode}/{i}"), timestamp=datetime.now())
+                for i in range(5)
+            ]
+
+        original_search = Mock(side_effect=search_side_effect)
+        mock_searcher.search = original_search
+
+        smart_searcher = create_smart_searcher(mock_searcher)
+        results = smart_searcher.search("test", max_results=5)
+
+        self.assertEqual(len(results), 5)
+        modes = [c.kwargs["mode"] for c in original_search.call_args_list]
+        self.assertNotIn("semantic", modes)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -145,49 +145,47 @@ class TestKeyboardHandlerCoverage(unittest.TestCase):
     def test_unix_keyboard_special_sequences(self):
         """Test Unix escape sequences"""
         with patch("sys.stdin.fileno", return_value=0), patch(
-            "realtime_search.select"
-        ) as mock_select, patch("sys.stdin") as mock_stdin:
+            "realtime_search.selectors"
+        ) as mock_selectors, patch("realtime_search.os.read") as mock_read:
 
             handler = KeyboardHandler()
 
             # Test escape sequences
             test_cases = [
-                (["\x1b", "[A"], "UP"),
-                (["\x1b", "[B"], "DOWN"),
-                (["\x1b", "[C"], "RIGHT"),
-                (["\x1b", "[D"], "LEFT"),
-                (["\x1b"], "ESC"),  # Just escape
-                (["\r"], "ENTER"),
-                (["\n"], "ENTER"),
-                (["\x7f"], "BACKSPACE"),
-                (["\x08"], "BACKSPACE"),
+                (b"\x1b[A", "UP"),
+                (b"\x1b[B", "DOWN"),
+                (b"\x1b[C", "RIGHT"),
+                (b"\x1b[D", "LEFT"),
+                (b"\x1b", "ESC"),  # Just escape
+                (b"\r", "ENTER"),
+                (b"\n", "ENTER"),
+                (b"\x7f", "BACKSPACE"),
+                (b"\x08", "BACKSPACE"),
             ]
 
-            for sequence, expected in test_cases:
+            for data, expected in test_cases:
                 with self.subTest(expected=expected):
-                    # Mock select to indicate data available
-                    mock_select.select.return_value = ([sys.stdin], [], [])
+                    # Mock the selector to indicate data available
+                    selector = mock_selectors.DefaultSelector.return_value
+                    selector.select.return_value = [True]
 
-                    # Mock stdin reads
-                    mock_stdin.read.side_effect = sequence
+                    # Mock the stdin read
+                    mock_read.return_value = data
 
                     result = handler.get_key()
                     self.assertEqual(result, expected)
 
-                    # Reset mocks
-                    mock_stdin.read.side_effect = None
-
     @patch("sys.platform", "linux")
     def test_unix_keyboard_ctrl_c(self):
         """Test Ctrl+C handling"""
         with patch("sys.stdin.fileno", return_value=0), patch(
-            "realtime_search.select"
-        ) as mock_select, patch("sys.stdin") as mock_stdin:
+            "realtime_search.selectors"
+        ) as mock_selectors, patch("realtime_search.os.read") as mock_read:
 
             handler = KeyboardHandler()
 
-            mock_select.select.return_value = ([sys.stdin], [], [])
-            mock_stdin.read.return_value = "\x03"  # Ctrl+C
+            mock_selectors.DefaultSelector.return_value.select.return_value = [True]
+            mock_read.return_value = b"\x03"  # Ctrl+C
 
             with self.assertRaises(KeyboardInterrupt):
                 handler.get_key()
@@ -207,11 +205,11 @@ class TestTerminalDisplayCoverage(unittest.TestCase):
         mock_system.assert_called_once_with("cls")
 
     @patch("sys.platform", "linux")
-    @patch("builtins.print")
-    def test_clear_screen_unix(self, mock_print):
+    @patch("sys.stdout")
+    def test_clear_screen_unix(self, mock_stdout):
         """Test clear screen on Unix"""
         self.display.clear_screen()
-        mock_print.assert_called_once_with("\033[2J\033[H", end="")
+        mock_stdout.buffer.write.assert_called_once_with(b"\033[2J\033[H")
 
     @patch("builtins.print")
     def test_cursor_operations(self, mock_print):
@@ -235,8 +233,8 @@ class TestTerminalDisplayCoverage(unittest.TestCase):
         self.display.restore_cursor()
         mock_print.assert_called_with("\033[u", end="")
 
-    @patch("builtins.print")
-    def test_draw_results_with_query_no_match(self, mock_print):
+    @patch("sys.stdout")
+    def test_draw_results_with_query_no_match(self, mock_stdout):
         """Test drawing results when query doesn't match"""
         results = [
             Mock(
@@ -248,10 +246,11 @@ class TestTerminalDisplayCoverage(unittest.TestCase):
         ]
 
         self.display.draw_results(results, 0, "nomatch")
+        self.display.flush()
 
         # Should still display result
-        calls = [str(call) for call in mock_print.call_args_list]
-        self.assertTrue(any("Some context" in str(call) for call in calls))
+        written = mock_stdout.buffer.write.call_args[0][0].decode("utf-8")
+        self.assertIn("Some context", written)
 
     @patch("builtins.print")
     @patch("sys.stdout")
@@ -277,7 +276,7 @@ class TestRealTimeSearchCoverage(unittest.TestCase):
         # Set up state for search
         self.rts.state.query = "test"
         self.rts.state.is_searching = True
-        self.rts.state.last_update = time.time() - 1
+        self.rts.state.last_update = time.monotonic() - 1
 
         # Make search raise exception
         self.rts.searcher.search.side_effect = Exception("Search failed")
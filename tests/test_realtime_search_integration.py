@@ -3,7 +3,9 @@
 Integration tests for real-time search with actual data
 """
 
+import shutil
 import sys
+import tempfile
 import time
 import unittest
 from pathlib import Path
@@ -28,15 +30,17 @@ class TestRealTimeSearchIntegration(unittest.TestCase):
         """Create test environment with sample conversations"""
         cls.temp_dir, cls.test_files = ConversationFixtures.create_test_environment()
         cls.search_dir = Path(cls.temp_dir) / ".claude" / "projects"
+        cls.cache_dir = Path(tempfile.mkdtemp())  # Keeps indexes out of ~/.claude
 
     @classmethod
     def tearDownClass(cls):
         """Clean up test environment"""
         cleanup_test_environment(cls.temp_dir)
+        shutil.rmtree(cls.cache_dir, ignore_errors=True)
 
     def setUp(self):
         """Set up searcher and extractor for each test"""
-        self.searcher = ConversationSearcher()
+        self.searcher = ConversationSearcher(cache_dir=self.cache_dir)
         self.extractor = ClaudeConversationExtractor()
         # Create smart searcher for RTS
         smart_searcher = create_smart_searcher(self.searcher)
@@ -51,7 +55,7 @@ class TestRealTimeSearchIntegration(unittest.TestCase):
         # Set up search state
         self.rts.state.query = "Python"
         self.rts.state.is_searching = True
-        self.rts.state.last_update = time.time() - 0.5  # Old enough to bypass debounce
+        self.rts.state.last_update = time.monotonic() - 0.5  # Old enough to bypass debounce
 
         # Process search
         result = self.rts._process_search_request()
@@ -106,7 +110,7 @@ class TestRealTimeSearchIntegration(unittest.TestCase):
         # First search
         self.rts.state.query = "database"
         self.rts.state.is_searching = True
-        self.rts.state.last_update = time.time() - 0.5
+        self.rts.state.last_update = time.monotonic() - 0.5
 
         # Process first search
         self.rts._process_search_request()
@@ -117,10 +121,10 @@ class TestRealTimeSearchIntegration(unittest.TestCase):
 
         # Second search (should use cache)
         self.rts.state.is_searching = True
-        self.rts.state.last_update = time.time() - 0.5
+        self.rts.state.last_update = time.monotonic() - 0.5
 
         # Clear searcher calls to verify cache is used
-        self.searcher = ConversationSearcher()
+        self.searcher = ConversationSearcher(cache_dir=self.cache_dir)
         original_search = self.searcher.search
         search_call_count = 0
 
@@ -166,7 +170,7 @@ class TestRealTimeSearchIntegration(unittest.TestCase):
         # Perform search
         self.rts.state.query = "error"
         self.rts.state.is_searching = True
-        self.rts.state.last_update = time.time() - 0.5
+        self.rts.state.last_update = time.monotonic() - 0.5
 
         self.rts._process_search_request()
 
@@ -222,7 +226,7 @@ class TestRealTimeSearchIntegration(unittest.TestCase):
         # Set empty query
         self.rts.state.query = ""
         self.rts.state.is_searching = True
-        self.rts.state.last_update = time.time() - 0.5
+        self.rts.state.last_update = time.monotonic() - 0.5
 
         # Add some existing results
         self.rts.state.results = [1, 2, 3]  # Dummy results
@@ -263,15 +267,17 @@ class TestRealTimeSearchWithExtractor(unittest.TestCase):
         """Create test environment"""
         cls.temp_dir, cls.test_files = ConversationFixtures.create_test_environment()
         cls.search_dir = Path(cls.temp_dir) / ".claude" / "projects"
+        cls.cache_dir = Path(tempfile.mkdtemp())  # Keeps indexes out of ~/.claude
 
     @classmethod
     def tearDownClass(cls):
         """Clean up test environment"""
         cleanup_test_environment(cls.temp_dir)
+        shutil.rmtree(cls.cache_dir, ignore_errors=True)
 
     def setUp(self):
         """Set up components"""
-        self.searcher = ConversationSearcher()
+        self.searcher = ConversationSearcher(cache_dir=self.cache_dir)
         self.extractor = ClaudeConversationExtractor(Path(self.temp_dir))
         self.rts = RealTimeSearch(self.searcher, self.extractor)
 
@@ -40,7 +40,7 @@ class TestRealTimeSearchThreading(unittest.TestCase):
         """Test debounce prevents immediate search"""
         self.rts.state.is_searching = True
         self.rts.state.query = "test"
-        self.rts.state.last_update = time.time()  # Just updated
+        self.rts.state.last_update = time.monotonic()  # Just updated
 
         result = self.rts._process_search_request()
 
@@ -51,7 +51,7 @@ class TestRealTimeSearchThreading(unittest.TestCase):
         """Test empty query clears results"""
         self.rts.state.is_searching = True
         self.rts.state.query = ""
-        self.rts.state.last_update = time.time() - 1  # Old enough
+        self.rts.state.last_update = time.monotonic() - 1  # Old enough
         self.rts.state.results = [Mock()]  # Has existing results
 
         result = self.rts._process_search_request()
@@ -66,7 +66,7 @@ class TestRealTimeSearchThreading(unittest.TestCase):
         self.rts.results_cache["cached"] = cached_results
         self.rts.state.is_searching = True
         self.rts.state.query = "cached"
-        self.rts.state.last_update = time.time() - 1
+        self.rts.state.last_update = time.monotonic() - 1
 
         result = self.rts._process_search_request()
 
@@ -80,7 +80,7 @@ class TestRealTimeSearchThreading(unittest.TestCase):
         self.mock_searcher.search.return_value = search_results
         self.rts.state.is_searching = True
         self.rts.state.query = "new query"
-        self.rts.state.last_update = time.time() - 1
+        self.rts.state.last_update = time.monotonic() - 1
 
         result = self.rts._process_search_request()
 
@@ -96,13 +96,68 @@ class TestRealTimeSearchThreading(unittest.TestCase):
         self.mock_searcher.search.side_effect = Exception("Search failed")
         self.rts.state.is_searching = True
         self.rts.state.query = "error query"
-        self.rts.state.last_update = time.time() - 1
+        self.rts.state.last_update = time.monotonic() - 1
 
         result = self.rts._process_search_request()
 
         self.assertTrue(result)
         self.assertEqual(self.rts.state.results, [])
 
+    def test_process_search_request_empty_prefix_skips_search(self):
+        """Test extending a query with no matches doesn't search again"""
+        self.mock_searcher.nlp = None
+        self.rts.results_cache["pyth"] = []
+        self.rts.state.is_searching = True
+        self.rts.state.query = "pythonx"
+        self.rts.state.last_update = time.monotonic() - 1
+
+        self.assertTrue(self.rts._process_search_request())
+
+        self.mock_searcher.search.assert_not_called()
+        self.assertEqual(self.rts.state.results, [])
+
+    def test_process_search_request_drops_stale_results(self):
+        """Test results for a query the user typed past are not shown"""
+        stale = [Mock()]
+
+        def search_then_type(**kwargs):
+            # User types another character while this search is running
+            self.rts.trigger_search()
+            return stale
+
+        self.mock_searcher.search.side_effect = search_then_type
+        self.rts.state.is_searching = True
+        self.rts.state.query = "test"
+        self.rts.state.last_update = time.monotonic() - 1
+
+        self.rts._process_search_request()
+
+        self.assertEqual(self.rts.state.results, [])
+        self.assertIs(self.rts.results_cache["test"], stale)
+
+    def test_worker_idles_until_search_triggered(self):
+        """Test the worker doesn't poll while idle and wakes on trigger"""
+        self.rts.debounce_delay = 0.05
+        self.rts.search_thread = threading.Thread(
+            target=self.rts.search_worker, daemon=True
+        )
+        with patch.object(
+            self.rts, "_process_search_request", return_value=True
+        ) as mock_process:
+            self.rts.search_thread.start()
+            try:
+                time.sleep(0.2)
+                mock_process.assert_not_called()
+
+                self.rts.state.query = "test"
+                self.rts.trigger_search()
+                time.sleep(0.2)
+                mock_process.assert_called_once()
+            finally:
+                self.rts.stop()
+
+        self.assertFalse(self.rts.search_thread.is_alive())
+
     def test_thread_lifecycle(self):
         """Test thread starts and stops properly"""
         # Start thread
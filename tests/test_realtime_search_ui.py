@@ -20,11 +20,13 @@ from realtime_search import RealTimeSearch, TerminalDisplay  # noqa: E402
 class MockKeyboardHandler:
     """Test keyboard handler that provides scripted input"""
 
-    def __init__(self, input_sequence, max_calls=100):
+    def __init__(self, input_sequence, max_calls=100, typeahead=False):
         self.input_sequence = list(input_sequence)
         self.index = 0
         self.call_count = 0
         self.max_calls = max_calls
+        # Whether keys arrive at once (a paste) rather than one per poll
+        self.typeahead = typeahead
 
     def __enter__(self):
         return self
@@ -34,6 +36,8 @@ class MockKeyboardHandler:
 
     def get_key(self, timeout=0.1):
         """Return next key from sequence"""
+        if timeout == 0 and not self.typeahead:
+            return None  # Next key hasn't been typed yet
         self.call_count += 1
         if self.call_count > self.max_calls:
             # Force exit to prevent infinite loop
@@ -59,7 +63,7 @@ class MockTerminalDisplay:
         self.results_drawn = []
         self.search_box_drawn = []
 
-    def clear_screen(self):
+    def clear_screen(self, flush=True):
         self.clear_count += 1
         self.output.append("CLEAR_SCREEN")
 
@@ -234,6 +238,54 @@ class TestRealTimeSearchUI(unittest.TestCase):
         self.assertIn("hel", queries)  # After backspaces
         self.assertIn("help", queries)  # After typing 'p'
 
+    def test_run_coalesces_typeahead(self):
+        """Test keys that arrive together are applied before a single redraw"""
+        input_sequence = ["h", "e", "l", "l", "o", None, "ESC"]
+
+        with patch(
+            "realtime_search.KeyboardHandler",
+            return_value=MockKeyboardHandler(input_sequence, typeahead=True),
+        ):
+            self.rts.run()
+
+        # Initial frame plus one frame for the whole burst
+        queries = [s["query"] for s in self.mock_display.search_box_drawn]
+        self.assertEqual(queries, ["", "hello"])
+
+    def test_run_skips_unchanged_frames(self):
+        """Test keys that change nothing visible don't redraw"""
+        input_sequence = ["LEFT", "UP", "DOWN", "ESC"]
+
+        with patch(
+            "realtime_search.KeyboardHandler",
+            return_value=MockKeyboardHandler(input_sequence),
+        ):
+            self.rts.run()
+
+        # Only the initial frame
+        self.assertEqual(len(self.mock_display.search_box_drawn), 1)
+        self.assertEqual(len(self.mock_display.results_drawn), 1)
+
+    def test_run_redraws_when_results_arrive(self):
+        """Test results delivered by the search thread are drawn without a key"""
+        new_results = [Mock()]
+        keyboard = MockKeyboardHandler([None, None, "ESC"])
+        get_key = keyboard.get_key
+
+        def deliver_results(timeout=0.1):
+            key = get_key(timeout)
+            if keyboard.index == 1:
+                self.rts.state.results = new_results
+            return key
+
+        keyboard.get_key = deliver_results
+
+        with patch("realtime_search.KeyboardHandler", return_value=keyboard):
+            self.rts.run()
+
+        self.assertEqual(len(self.mock_display.results_drawn), 2)
+        self.assertIs(self.mock_display.results_drawn[1]["results"][0], new_results[0])
+
     def test_thread_starts_and_stops(self):
         """Test that search thread lifecycle is managed properly"""
         input_sequence = ["t", "e", "s", "t", "ESC"]
@@ -283,34 +335,30 @@ class TestTerminalDisplay(unittest.TestCase):
         self.display = TerminalDisplay()
         self.captured_output = []
 
-    @patch("builtins.print")
-    def test_draw_header(self, mock_print):
-        """Test header drawing"""
-        self.display.draw_header()
+    def _render(self, draw):
+        """Run a draw call and return everything written to the terminal"""
+        with patch("sys.stdout") as mock_stdout:
+            draw()
+            self.display.flush()
+        return b"".join(
+            call[0][0] for call in mock_stdout.buffer.write.call_args_list
+        ).decode("utf-8")
 
-        # Verify header content
-        calls = [
-            call[0][0] if call[0] else call[1].get("end", "")
-            for call in mock_print.call_args_list
-        ]
-        output = "".join(str(c) for c in calls)
+    def test_draw_header(self):
+        """Test header drawing"""
+        output = self._render(self.display.draw_header)
 
         self.assertIn("REAL-TIME SEARCH", output)
         self.assertIn("Type to search", output)
         self.assertIn("ESC to exit", output)
 
-    @patch("builtins.print")
-    def test_draw_results_empty(self, mock_print):
+    def test_draw_results_empty(self):
         """Test drawing with no results"""
-        self.display.draw_results([], 0, "")
-
-        calls = [call[0][0] if call[0] else "" for call in mock_print.call_args_list]
-        output = "".join(str(c) for c in calls)
+        output = self._render(lambda: self.display.draw_results([], 0, ""))
 
         self.assertIn("Start typing to search", output)
 
-    @patch("builtins.print")
-    def test_draw_results_with_items(self, mock_print):
+    def test_draw_results_with_items(self):
         """Test drawing actual results"""
         results = [
             Mock(
@@ -321,10 +369,7 @@ class TestTerminalDisplay(unittest.TestCase):
             )
         ]
 
-        self.display.draw_results(results, 0, "search")
-
-        calls = [call[0][0] if call[0] else "" for call in mock_print.call_args_list]
-        output = "".join(str(c) for c in calls)
+        output = self._render(lambda: self.display.draw_results(results, 0, "search"))
 
         # Should show selection indicator for selected item
         self.assertIn("▸", output)
@@ -332,5 +377,135 @@ class TestTerminalDisplay(unittest.TestCase):
         self.assertIn("test", output)
 
 
+    def test_preview_highlight_emits_single_style_pair(self):
+        """Test the query match is wrapped in exactly one SGR on/off pair"""
+        runs = self.display._format_preview("Fix the Python error", "python")
+        output = self._render(lambda: self.display._write_runs(runs))
+
+        self.assertEqual(output, "Fix the \033[93mPython\033[0m error")
+
+    def test_preview_centers_on_late_match(self):
+        """Test a match past the visible width is scrolled into the preview"""
+        text = "a" * 100 + " python error " + "b" * 100
+        runs = self.display._format_preview(text, "python")
+
+        self.assertEqual(runs[0], (None, "…" + "a" * 19 + " "))
+        self.assertEqual(runs[1], (TerminalDisplay.HIGHLIGHT, "python"))
+        self.assertEqual(len("".join(t for _, t in runs)), 60)
+
+    def test_preview_long_query_without_match_not_scrolled(self):
+        """Test a long query with no match shows the start of the text"""
+        text = "abcdefghij" * 10
+        runs = self.display._format_preview(text, "x" * 65)
+
+        self.assertEqual(runs, [(None, text[:60])])
+
+    def test_preview_long_query_early_match_not_scrolled(self):
+        """Test a long match near the start keeps the preview at the start"""
+        query = "z" * 50
+        text = "a" * 15 + query + "b" * 40
+        runs = self.display._format_preview(text, query)
+
+        self.assertEqual(runs[0], (None, "a" * 15))
+        self.assertEqual(runs[1], (TerminalDisplay.HIGHLIGHT, "z" * 45))
+
+    def test_preview_without_match_has_no_styling(self):
+        """Test previews that don't contain the query emit no SGR codes"""
+        for query in ("", "missing"):
+            runs = self.display._format_preview("plain text", query)
+            output = self._render(lambda: self.display._write_runs(runs))
+            self.assertEqual(output, "plain text")
+
+
+    def test_selection_move_redraws_only_changed_rows(self):
+        """Test moving the selection rewrites just the old and new rows"""
+        results = [
+            Mock(
+                file_path=Path(f"/test/chat{i}.jsonl"),
+                timestamp=datetime.now(),
+                context=f"Result {i}",
+                speaker="human",
+            )
+            for i in range(3)
+        ]
+        self._render(lambda: self.display.draw_results(results, 0, "result"))
+
+        output = self._render(lambda: self.display.draw_results(results, 1, "result"))
+
+        self.assertEqual(output.count("\033[2K"), 2)
+        self.assertIn("\033[5;1H", output)
+        self.assertIn("\033[6;1H", output)
+        self.assertNotIn("\033[7;1H", output)
+
+    def test_result_info_formatted_once(self):
+        """Test a result's date and project are formatted only on first draw"""
+        timestamp = Mock()
+        timestamp.strftime.return_value = "2024-01-15"
+        results = [
+            Mock(
+                file_path=Path(f"/test/project/chat{i}.jsonl"),
+                timestamp=timestamp,
+                context=f"Result {i}",
+                speaker="human",
+            )
+            for i in range(2)
+        ]
+        self._render(lambda: self.display.draw_results(results, 0, "result"))
+        output = self._render(lambda: self.display.draw_results(results, 1, "result"))
+
+        self.assertIn("2024-01-15 | project | ", output)
+        self.assertEqual(timestamp.strftime.call_count, 2)
+
+    @patch("sys.platform", "linux")
+    def test_first_frame_is_a_single_write(self):
+        """Test the clear, header, results and search box share one write"""
+        with patch("sys.stdout") as mock_stdout:
+            self.display.clear_screen(flush=False)
+            self.display.draw_header()
+            self.display.draw_results([], 0, "")
+            self.display.draw_search_box("", 0)
+
+        mock_stdout.buffer.write.assert_called_once()
+        frame = mock_stdout.buffer.write.call_args[0][0]
+        self.assertTrue(frame.startswith(b"\033[2J\033[H"))
+        self.assertIn(b"Search: ", frame)
+
+    def test_fewer_results_clear_to_end_of_screen(self):
+        """Test shrinking the result list clears leftover rows in one escape"""
+        results = [
+            Mock(
+                file_path=Path(f"/test/chat{i}.jsonl"),
+                timestamp=datetime.now(),
+                context=f"Result {i}",
+                speaker="human",
+            )
+            for i in range(3)
+        ]
+        self._render(lambda: self.display.draw_results(results, 0, "result"))
+
+        output = self._render(
+            lambda: self.display.draw_results(results[:1], 0, "result")
+        )
+
+        self.assertTrue(output.endswith("\033[6;1H\033[J"))
+        self.assertNotIn("\033[2K", output)
+
+    def test_unchanged_results_redraw_nothing(self):
+        """Test redrawing identical results writes no row output"""
+        results = [
+            Mock(
+                file_path=Path("/test/chat.jsonl"),
+                timestamp=datetime.now(),
+                context="Result",
+                speaker="human",
+            )
+        ]
+        self._render(lambda: self.display.draw_results(results, 0, "result"))
+
+        output = self._render(lambda: self.display.draw_results(results, 0, "result"))
+
+        self.assertEqual(output, "")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -122,38 +122,30 @@ class TestRealTimeSearchUnit(unittest.TestCase):
         self.assertGreater(second_update, first_update)
         self.assertTrue(self.rts.state.is_searching)
 
-    def test_trigger_search_cache_cleanup(self):
-        """Test cache cleanup on search trigger"""
-        # Populate cache
-        self.rts.results_cache = {
-            "test": [Mock()],
-            "testing": [Mock()],
-            "other": [Mock()],
-            "te": [Mock()],
-            "t": [Mock()],
-        }
-
-        # Trigger search for "tes"
-        self.rts.state.query = "tes"
-        self.rts.trigger_search()
+    def test_results_cache_lru_eviction(self):
+        """Test the results cache evicts least recently used queries"""
+        self.rts.max_cache = 3
+        self.rts.searcher.search.return_value = []
+
+        for query in ("t", "te", "tes"):
+            self.rts._cache_results(query, [Mock()])
+
+        # A cache hit marks "t" as recently used
+        self.rts.state.query = "t"
+        self.rts.state.is_searching = True
+        self.rts.state.last_update = time.monotonic() - 1
+        self.rts._process_search_request()
+
+        self.rts._cache_results("test", [Mock()])
 
-        # Should only keep entries starting with "tes"
-        self.assertIn("test", self.rts.results_cache)
-        self.assertIn("testing", self.rts.results_cache)
-        self.assertNotIn("other", self.rts.results_cache)
-        self.assertNotIn(
-            "te", self.rts.results_cache
-        )  # Removed - doesn't start with "tes"
-        self.assertNotIn(
-            "t", self.rts.results_cache
-        )  # Removed - doesn't start with "tes"
+        self.assertEqual(list(self.rts.results_cache), ["tes", "t", "test"])
 
     def test_search_logic(self):
         """Test search logic components"""
         # Test empty query handling
         self.rts.state.query = ""
         self.rts.state.is_searching = True
-        self.rts.state.last_update = time.time() - 1
+        self.rts.state.last_update = time.monotonic() - 1
 
         # The search worker would clear results for empty query
         # We'll test this by simulating the logic
@@ -93,7 +93,7 @@ class TestConversationSearcher(unittest.TestCase):
             for conv in self.test_conversations:
                 f.write(json.dumps(conv) + "\n")
 
-        self.searcher = ConversationSearcher()
+        self.searcher = ConversationSearcher(cache_dir=Path(self.temp_dir) / "cache")
 
     def tearDown(self):
         """Clean up test files"""
@@ -198,6 +198,223 @@ class TestConversationSearcher(unittest.TestCase):
         # Empty query should return no results (not all messages)
         self.assertEqual(len(results), 0)
 
+    def test_repeat_search_reuses_parsed_file(self):
+        """Test a second search doesn't re-read an unchanged file"""
+        self.searcher.search("python", search_dir=self.test_dir, mode="exact")
+
+        with patch.object(Path, "read_bytes", side_effect=AssertionError("re-read")):
+            results = self.searcher.search(
+                "except", search_dir=self.test_dir, mode="regex"
+            )
+
+        self.assertEqual(len(results), 1)
+
+    def test_modified_file_is_reparsed(self):
+        """Test cached messages are dropped when the file changes"""
+        self.searcher.search("python", search_dir=self.test_dir, mode="exact")
+
+        with open(self.test_file, "a") as f:
+            f.write(json.dumps({"type": "user", "content": "Now about Rust"}) + "\n")
+
+        results = self.searcher.search("rust", search_dir=self.test_dir, mode="exact")
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].line_number, 4)
+
+    def test_large_file_streamed(self):
+        """Test files over the slurp limit are streamed with the same results"""
+        with patch("search_conversations._SLURP_LIMIT", 0), patch.object(
+            Path, "read_bytes", side_effect=AssertionError("slurped")
+        ):
+            results = self.searcher.search(
+                "file operations", search_dir=self.test_dir, mode="exact"
+            )
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].line_number, 3)
+
+    def test_regex_compiled_once(self):
+        """Test a regex pattern is compiled once across repeated searches"""
+        import re
+
+        import search_conversations
+
+        search_conversations._compile.cache_clear()
+        with patch("search_conversations.re.compile", wraps=re.compile) as mock_compile:
+            for _ in range(2):
+                self.searcher.search(
+                    r"try.*except", search_dir=self.test_dir, mode="regex"
+                )
+
+        mock_compile.assert_called_once_with(r"try.*except", re.IGNORECASE)
+
+    def test_terms_within_window(self):
+        """Test the proximity check finds terms within twice their count"""
+        words = "use try and except blocks to handle python errors".split()
+
+        self.assertTrue(
+            self.searcher._terms_within_window(words, {"python", "errors"})
+        )
+        self.assertTrue(self.searcher._terms_within_window(words, {"try", "except"}))
+        self.assertFalse(self.searcher._terms_within_window(words, {"use", "python"}))
+
+    def test_undecodable_lines_skipped(self):
+        """Test malformed and non-UTF-8 lines don't stop a file being searched"""
+        with open(self.test_file, "ab") as f:
+            f.write(b"{not json}\n\xff\xfe\n")
+            f.write(json.dumps({"type": "user", "content": "Rust later"}).encode())
+
+        results = self.searcher.search("rust", search_dir=self.test_dir, mode="exact")
+
+        self.assertEqual([r.line_number for r in results], [6])
+
+    def test_loaded_messages_carry_lowercase_text(self):
+        """Test parsed messages keep a lowercased copy for case-insensitive search"""
+        messages = self.searcher._load_conversation(self.test_file)
+
+        self.assertEqual(len(messages), 3)
+        for _, _, content, content_lower, _ in messages:
+            self.assertEqual(content_lower, content.lower())
+
+    def test_batch_decode_keeps_line_numbers(self):
+        """Test lines decoded together keep their own line numbers"""
+        with open(self.test_file, "ab") as f:
+            # A blank line, then two lines that only parse when joined
+            f.write(b"\n[1\n2]\n")
+            f.write(json.dumps({"type": "user", "content": "Rust later"}).encode())
+
+        results = self.searcher.search("rust", search_dir=self.test_dir, mode="exact")
+
+        self.assertEqual([r.line_number for r in results], [7])
+
+    def test_regex_needle(self):
+        """Test required literals are taken only from safe top-level text"""
+        from search_conversations import _regex_needle
+
+        self.assertEqual(_regex_needle(r"try.*except", False), b"except")
+        self.assertEqual(_regex_needle(r"PostgreSQL\s+db", True), b"postgresql")
+        # i, k and s also match non-ASCII letters when ignoring case
+        self.assertEqual(_regex_needle(r"PostgreSQL", False), b"tgre")
+        self.assertIsNone(_regex_needle(r"foo|bar", True))
+        self.assertIsNone(_regex_needle(r"abc*", True))
+        self.assertIsNone(_regex_needle(r"[", False))
+        # Spaces may come from joining list content parts
+        self.assertEqual(_regex_needle(r"handle errors?", False), b"handle")
+
+    def test_literal_regex_matches_like_regex(self):
+        """Test plain-text patterns found with str.find match the regex path"""
+        test_file = self.test_dir / "chat_literal.jsonl"
+        test_file.write_text(
+            json.dumps({"type": "user", "content": "Python and PYTHON and python"})
+            + "\n"
+            + json.dumps({"type": "assistant", "content": "Café python, Python"})
+            + "\n"
+        )
+
+        for case_sensitive in (False, True):
+            literal = self.searcher._search_regex(
+                test_file, "python", None, case_sensitive
+            )
+            regex = self.searcher._search_regex(
+                test_file, "pytho[n]", None, case_sensitive
+            )
+            self.assertEqual(
+                [(r.matched_content, r.context, r.relevance_score) for r in literal],
+                [(r.matched_content, r.context, r.relevance_score) for r in regex],
+            )
+
+    def test_iter_jsonl_matches_rglob(self):
+        """Test the scandir walker finds the same files as rglob"""
+        from search_conversations import _iter_jsonl
+
+        nested = self.test_dir / "project" / "sub"
+        nested.mkdir(parents=True)
+        (nested / "deep.jsonl").write_text("")
+        (self.test_dir / "project" / "notes.txt").write_text("")
+        (self.test_dir / "dir.jsonl").mkdir()
+
+        self.assertEqual(
+            sorted(_iter_jsonl(self.test_dir)),
+            sorted(p for p in self.test_dir.rglob("*.jsonl") if p.is_file()),
+        )
+        self.assertIn(nested / "deep.jsonl", list(_iter_jsonl(self.test_dir)))
+
+    def test_regex_prefilter_skips_unparsed_files(self):
+        """Test files without the regex's literal text are never parsed"""
+        other_file = self.test_dir / "chat_other.jsonl"
+        other_file.write_text(
+            json.dumps({"type": "user", "content": "Nothing relevant here"}) + "\n"
+        )
+
+        with patch.object(
+            self.searcher,
+            "_load_conversation",
+            wraps=self.searcher._load_conversation,
+        ) as mock_load:
+            results = self.searcher.search(
+                r"try.*except", search_dir=self.test_dir, mode="regex"
+            )
+
+        self.assertEqual(len(results), 1)
+        loaded = [c[0][0].name for c in mock_load.call_args_list]
+        self.assertEqual(loaded, ["chat_test.jsonl"])
+
+    def test_regex_prefilter_matches_across_content_parts(self):
+        """Test a literal spanning two content parts doesn't skip the file"""
+        parts_file = self.test_dir / "chat_parts.jsonl"
+        entry = {
+            "type": "user",
+            "message": {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": "How do I handle"},
+                    {"type": "text", "text": "errors in a loop?"},
+                ],
+            },
+        }
+        parts_file.write_text(json.dumps(entry) + "\n")
+
+        results = self.searcher.search(
+            r"handle errors?", search_dir=self.test_dir, mode="regex"
+        )
+
+        self.assertIn(parts_file, [r.file_path for r in results])
+
+    def test_regex_prefilter_keeps_unreadable_files(self):
+        """Test a read error in the regex prefilter doesn't abort the search"""
+        with patch(
+            "search_conversations._raw_contains", side_effect=OSError("gone")
+        ):
+            results = self.searcher.search(
+                r"try.*except", search_dir=self.test_dir, mode="regex"
+            )
+
+        self.assertEqual(len(results), 1)
+
+    def test_files_searched_concurrently(self):
+        """Test multi-file searches use the worker pool and match a serial scan"""
+        for i in range(3):
+            with open(self.test_dir / f"chat_extra{i}.jsonl", "w") as f:
+                f.write(json.dumps({"type": "user", "content": f"python {i}"}) + "\n")
+
+        results = self.searcher.search(
+            "python", search_dir=self.test_dir, mode="exact"
+        )
+
+        self.assertIsNotNone(self.searcher._executor)
+        files = sorted(self.test_dir.rglob("*.jsonl"))
+        expected = [
+            r
+            for f in files
+            for r in self.searcher._search_exact(f, "python", None, False)
+        ]
+        expected.sort(key=lambda r: r.relevance_score, reverse=True)
+        self.assertEqual(len(files), 4)
+        self.assertEqual(
+            sorted((r.file_path, r.line_number) for r in results),
+            sorted((r.file_path, r.line_number) for r in expected),
+        )
+
 
 class TestSearchState(unittest.TestCase):
     """Test SearchState dataclass"""
@@ -283,16 +500,17 @@ class TestTerminalDisplay(unittest.TestCase):
         with patch("sys.platform", "darwin"):
             self.display.clear_screen()
             # Should output ANSI clear screen sequence
-            mock_stdout.write.assert_called()
+            mock_stdout.buffer.write.assert_called_once_with(b"\033[2J\033[H")
 
     @patch("sys.stdout")
     def test_draw_header(self, mock_stdout):
         """Test header drawing"""
         self.display.draw_header()
+        self.display.flush()
         # Verify header text was printed
-        printed_text = "".join(
-            call[0][0] for call in mock_stdout.write.call_args_list if call[0][0]
-        )
+        printed_text = b"".join(
+            call[0][0] for call in mock_stdout.buffer.write.call_args_list
+        ).decode("utf-8")
         self.assertIn("REAL-TIME SEARCH", printed_text)
 
     def test_draw_results_empty(self):
@@ -465,7 +683,7 @@ class TestIntegration(unittest.TestCase):
 
     def test_end_to_end_search(self):
         """Test complete search workflow"""
-        searcher = ConversationSearcher()
+        searcher = ConversationSearcher(cache_dir=Path(self.temp_dir) / "cache")
 
         # Search across all projects
         results = searcher.search(
@@ -62,7 +62,7 @@ class TestConversationSearcher(unittest.TestCase):
     def setUp(self):
         """Set up test environment"""
         self.temp_dir = tempfile.mkdtemp()
-        self.searcher = ConversationSearcher()
+        self.searcher = ConversationSearcher(cache_dir=Path(self.temp_dir) / "cache")
 
         # Create test conversation files
         self.create_test_conversations()
@@ -327,7 +327,7 @@ class TestSearchIntegration(unittest.TestCase):
     def setUp(self):
         """Set up test environment"""
         self.temp_dir = tempfile.mkdtemp()
-        self.searcher = ConversationSearcher()
+        self.searcher = ConversationSearcher(cache_dir=Path(self.temp_dir) / "cache")
 
     def tearDown(self):
         """Clean up test environment"""
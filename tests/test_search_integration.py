@@ -4,7 +4,9 @@ Integration tests for search functionality using sample conversations
 """
 
 import os
+import shutil
 import sys
+import tempfile
 import unittest
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -14,7 +16,8 @@ sys.path.append(str(Path(__file__).parent.parent))
 sys.path.append(str(Path(__file__).parent))
 
 # Local imports after sys.path modification
-from fixtures.sample_conversations import (ConversationFixtures,  # noqa: E402
+from fixtures.sample_conversations import (REGEX_QUERIES,  # noqa: E402
+                                           ConversationFixtures,
                                            cleanup_test_environment)
 from search_conversations import ConversationSearcher  # noqa: E402
 
@@ -27,15 +30,17 @@ class TestSearchIntegration(unittest.TestCase):
         """Create test environment once for all tests"""
         cls.temp_dir, cls.test_files = ConversationFixtures.create_test_environment()
         cls.search_dir = Path(cls.temp_dir) / ".claude" / "projects"
+        cls.cache_dir = Path(tempfile.mkdtemp())  # Keeps indexes out of ~/.claude
 
     @classmethod
     def tearDownClass(cls):
         """Clean up test environment"""
         cleanup_test_environment(cls.temp_dir)
+        shutil.rmtree(cls.cache_dir, ignore_errors=True)
 
     def setUp(self):
         """Set up each test"""
-        self.searcher = ConversationSearcher()
+        self.searcher = ConversationSearcher(cache_dir=self.cache_dir)
         self.expected_results = ConversationFixtures.get_expected_search_results()
 
     def test_exact_matches(self):
@@ -110,6 +115,18 @@ class TestSearchIntegration(unittest.TestCase):
                         f"Expected to find '{expected_id}' for pattern '{pattern}'",
                     )
 
+    def test_matches_reference_results(self):
+        """Test exact and regex search find exactly the reference conversations"""
+        for query, expected_ids in self.expected_results.items():
+            mode = "regex" if query in REGEX_QUERIES else "exact"
+            with self.subTest(query=query, mode=mode):
+                results = self.searcher.search(
+                    query=query, search_dir=self.search_dir, mode=mode
+                )
+
+                found_ids = {r.file_path.stem.replace("chat_", "") for r in results}
+                self.assertEqual(found_ids, set(expected_ids))
+
     def test_case_sensitivity(self):
         """Test case-sensitive vs case-insensitive search"""
         # Case-insensitive (default)
@@ -152,9 +169,18 @@ class TestSearchIntegration(unittest.TestCase):
 
     def test_date_filter(self):
         """Test date range filtering"""
+        # Date a copy, since the shared tree must stay as other tests expect
+        copy_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, copy_dir, True)
+        shutil.copytree(self.temp_dir, copy_dir / "tree")
+        search_dir = copy_dir / "tree" / ".claude" / "projects"
+        test_files = [
+            search_dir / f.relative_to(self.search_dir) for f in self.test_files
+        ]
+
         # Set specific modification times for our test files
         base_date = datetime(2024, 1, 15)
-        for i, test_file in enumerate(self.test_files):
+        for i, test_file in enumerate(test_files):
             # Set files to different dates
             file_time = (base_date + timedelta(days=i)).timestamp()
             os.utime(test_file, (file_time, file_time))
@@ -165,7 +191,7 @@ class TestSearchIntegration(unittest.TestCase):
 
         results = self.searcher.search(
             query="",  # Empty query to test just date filtering
-            search_dir=self.search_dir,
+            search_dir=search_dir,
             date_from=date_from,
             date_to=date_to,
         )
@@ -173,7 +199,7 @@ class TestSearchIntegration(unittest.TestCase):
         # Due to empty query handling, let's search for something common
         results = self.searcher.search(
             query="the",
-            search_dir=self.search_dir,
+            search_dir=search_dir,
             date_from=date_from,
             date_to=date_to,
         )
@@ -260,11 +286,13 @@ class TestSearchPerformance(unittest.TestCase):
         """Create a larger test dataset"""
         self.temp_dir, self.test_files = ConversationFixtures.create_test_environment()
         self.search_dir = Path(self.temp_dir) / ".claude" / "projects"
-        self.searcher = ConversationSearcher()
+        self.cache_dir = Path(tempfile.mkdtemp())
+        self.searcher = ConversationSearcher(cache_dir=self.cache_dir)
 
     def tearDown(self):
         """Clean up test environment"""
         cleanup_test_environment(self.temp_dir)
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
 
     def test_search_performance(self):
         """Test that search completes in reasonable time"""